@@ -10,16 +10,36 @@ Kullanım örnekleri:
 
   # 3) Normal koşu (kalibrasyon varsa otomatik kullanır)
   python site_bulucu_pro.py --mode run --input input.csv --output cikti.csv --deep-verify on --prob-threshold 0.65
+
+  # 4) Büyük listeler: tüm firmalar tek event loop'ta (global + host başına eşzamanlılık sınırı)
+  python site_bulucu_pro.py --mode run --input input.csv --output cikti.csv --engine async
+
+  # 5) Toplu mod: 16 firma paralel, çıktı girdi sırasında, ilerleme satır/sn + ETA
+  python site_bulucu_pro.py --mode run --input input.csv --output cikti.csv --workers 16
+
+  # 6) Akış modu: parça parça oku, her sonucu hemen yaz; kesilirse --resume ile kaldığı yerden devam
+  python site_bulucu_pro.py --mode run --input input.csv --output cikti.csv --workers 16 --stream --chunksize 5000
+  python site_bulucu_pro.py --mode run --input input.csv --output cikti.csv --workers 16 --resume
+
+  # 7) Ağ yanıtlarını kasete kaydet, ardından PUANLAR denemelerini ağa çıkmadan tekrar oynat
+  python site_bulucu_pro.py --mode run --input input.csv --output cikti.csv --cassette-mode record --cassette kaset.jsonl
+  python site_bulucu_pro.py --mode run --input input.csv --output cikti.csv --cassette-mode replay --cassette kaset.jsonl --profile
 """
 
-import argparse, json, pickle, ssl, socket, os
+import argparse, json, pickle, ssl, socket, os, csv
+import asyncio, threading, queue, atexit, zlib, hashlib, functools, copy, marshal
 import pandas as pd
 import requests, sqlite3, time, random, re, html, difflib
+from collections import deque, OrderedDict, Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from bs4 import BeautifulSoup
-from urllib.parse import urlparse, quote_plus
+from urllib.parse import urlparse, urlunparse, quote_plus, urljoin
 from urllib.error import HTTPError
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, List, Dict, Tuple, Optional
+try:
+    import zstandard  # opsiyonel: CACHE_SIKISTIRMA='zstd'
+except ImportError:
+    zstandard = None
 
 # ===== AYARLAR =====
 AYARLAR = {
@@ -98,19 +118,65 @@ AYARLAR = {
 
     'DOGRALANACAK_EN_IYI_ADAY_SAYISI': 4,
     'ISTEK_ZAMAN_ASIMI': 6,
+    'MAX_SAYFA_BAYT': 2_000_000,    # sayfa gövdesi bu kadar bayttan sonra kesilir (None = sınırsız)
+    'KABUL_EDILEN_ICERIK': ('text/html', 'application/xhtml+xml', 'text/xml', 'application/xml', 'text/plain'),
+
+    # HTTP bağlantı havuzu (None = --workers/--engine eşzamanlılığından hesaplanır)
+    'HTTP_HAVUZ_SAYISI': None,      # önbellekte tutulan host havuzu sayısı (pool_connections)
+    'HTTP_HOST_BAGLANTI': None,     # host başına tutulan en fazla açık bağlantı (pool_maxsize)
+    'HTTP_KEEPALIVE': True,         # TCP SO_KEEPALIVE (boştaki bağlantılar ara cihazlarca kesilmesin)
+
+    # Kayıt / tekrar oynatma (--cassette-mode)
+    'KASET_DOSYASI': 'site_finder_cassette.jsonl',  # fetch / arama / DNS / SSL yanıtları (JSONL, sonradan yazılan geçerli)
 
     'CACHE_DB': 'site_finder_cache.sqlite',
+    'PSL_DOSYASI': os.path.join(os.path.dirname(os.path.abspath(__file__)), 'public_suffix_list.dat'),  # publicsuffix.org, ICANN bölümü
+    'PSL_DERLENMIS': 'site_finder_psl.marshal',   # trie'nin derlenmiş hali (PSL değişince yeniden üretilir)
+    'CACHE_YAZ_PAKET': 256,         # write-behind: tek commit'te en fazla kayıt
+    'CACHE_YAZ_ARALIK': 1.0,        # write-behind: paket toplama süresi (sn)
+    'CACHE_TTL': {                  # tablo -> saniye (None = süresiz)
+        'url_cache': 7 * 86400,
+        'query_cache': 3 * 86400,
+        'neg_cache': 6 * 3600,      # başarısız fetch / ölü host kayıtları
+        'dns_cache': 86400,         # domain -> çözülen adresler
+        'cert_cache': 7 * 86400,    # domain -> sertifika subject/SAN adları
+        'sig_cache': 7 * 86400,     # içerik hash'i -> normalize sinyal sözlüğü (SIG_KALICI)
+    },
+    'CACHE_SIKISTIRMA': 'zlib',     # 'zstd' (zstandard kuruluysa) | 'zlib' | None
+    'CACHE_MAX_MB': 512,            # aşılırsa en eski yazılmış (ts) url_cache kayıtları silinir; FIFO, LRU değil: okuma zamanı tutulmaz (None = sınırsız)
+    'CACHE_TEMIZLIK_ARALIGI': 1000, # kaç yazmada bir TTL/boyut temizliği yapılır
+
+    # HTML parse
+    'HTML_PARSER': 'html.parser',   # 'lxml' (kuruluysa) daha hızlı
+    'SIG_BELLEK_KAYIT': 5000,       # bellekteki parse sonucu (içerik hash'i başına) sayısı
+    'SIG_KALICI': False,            # True: sinyal sözlüğü sig_cache tablosuna da yazılır
     'GOOGLE_RESULTS_PER_QUERY': 4,
     'DUCK_RESULTS_PER_QUERY': 8,
 
     # Deep verify
     'DEEP_PATHS': ["", "iletisim", "hakkimizda", "about", "contact"],
+    'DEEP_MAX_SAYFA': 4,            # kökten/sitemap'ten keşfedilen en fazla sayfa
+    'DEEP_TAHMIN_YEDEK': True,      # bağlantı bulunamazsa DEEP_PATHS tahminleri denenir
     'MIN_SINYAL_AUTO_DOMAIN': 2,
     'GECER_MIN_PUAN': 5,
 
+    # Review modu aday bütçesi
+    'REVIEW_FETCH_BUDGET': 12,      # firma başına içeriği değerlendirilecek en fazla aday (None = sınırsız)
+    'REVIEW_DALGA': 8,              # aynı anda değerlendirilen aday sayısı
+
     # Kalibrasyon
     'CALIB_MODEL': 'calibration_model.pkl',
     'CALIB_JSON_FALLBACK': 'calibration_fallback.json',
+    'CALIB_KONTROL_ARALIGI': 5.0,   # sn; model dosyası değişti mi (mtime) kontrolü, değiştiyse sıcak yükleme
+    'CALIB_ISCI': 8,                # kalibrasyonda eksik özellikleri paralel hesaplayan thread sayısı
+
+    # Async motor (--engine async)
+    'ASYNC_MAX_INFLIGHT': 64,       # tüm firmalar için aynı anda uçuştaki istek üst sınırı
+    'ASYNC_HOST_BASINA': 4,         # aynı host'a aynı anda en fazla istek
+    'ASYNC_FIRMA_PENCERESI': 500,   # aynı anda işlenen firma sayısı
+
+    # Akış modu (--stream)
+    'AKIS_PARCA': 5000,             # girdi CSV'si bu kadar satırlık parçalarla okunur
 }
 
 # Şirket eki ve domain yasakları
@@ -122,7 +188,7 @@ SIRKET_EKLERI = {
 }
 DOMAIN_EK_YASAKLARI = {"ltd","sti","as","anonim","limited","holding","group","grup","sanayi","ticaret"}
 
-# Türkiye yaygın public suffix'ler (minimal PSL)
+# Türkiye yaygın public suffix'ler (minimal PSL; public_suffix_list.dat okunamazsa kullanılır)
 PUBLIC_SUFFIXES = {
     # TR
     "com.tr","org.tr","net.tr","gen.tr","biz.tr","info.tr","av.tr","dr.tr","pol.tr","bel.tr","k12.tr","edu.tr","gov.tr","tsk.tr","bbs.tr","name.tr","web.tr","tv.tr",
@@ -149,17 +215,338 @@ PARKING_KALIPLARI = [
     "under construction", "site yapim asamasinda", "site yapım aşamasında"
 ]
 
+# ===== Ölçüm (--profile) =====
+class Olcum:
+    """Süreç içi sayaç + gecikme histogramı kaydı (thread-safe, bağımlılıksız).
+
+    sure(ad) bağlam yöneticisi / olculen(ad) dekoratörü çağrı sayısını ve süresini yazar;
+    say(ad) düz sayaç artırır. ozet() JSON'a uygun sözlük, prometheus() textfile biçimi döner.
+    """
+    KOVALAR_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+    def __init__(self):
+        self._kilit = threading.Lock()
+        self.sifirla()
+
+    def sifirla(self):
+        with self._kilit:
+            self.sayaclar: Dict[str, int] = {}
+            self.histogramlar: Dict[str, List] = {}  # ad -> [kova_sayilari..., +Inf, toplam_ms, en_buyuk_ms]
+            self.t0 = time.time()
+
+    def say(self, ad:str, n:int=1):
+        with self._kilit:
+            self.sayaclar[ad] = self.sayaclar.get(ad, 0) + n
+
+    def gozlem(self, ad:str, ms:float):
+        kova = len(self.KOVALAR_MS)
+        for j, ust in enumerate(self.KOVALAR_MS):
+            if ms <= ust:
+                kova = j; break
+        with self._kilit:
+            h = self.histogramlar.get(ad)
+            if h is None:
+                h = self.histogramlar[ad] = [0] * (len(self.KOVALAR_MS) + 1) + [0.0, 0.0]
+            h[kova] += 1
+            h[-2] += ms
+            if ms > h[-1]: h[-1] = ms
+
+    class _Sure:
+        __slots__ = ('olcum', 'ad', 't')
+        def __init__(self, olcum, ad):
+            self.olcum, self.ad = olcum, ad
+        def __enter__(self):
+            self.t = time.perf_counter()
+            return self
+        def __exit__(self, *exc):
+            self.olcum.gozlem(self.ad, (time.perf_counter() - self.t) * 1000.0)
+            return False
+
+    def sure(self, ad:str) -> "Olcum._Sure":
+        return Olcum._Sure(self, ad)
+
+    def olculen(self, ad:str):
+        def dekorator(fn):
+            if asyncio.iscoroutinefunction(fn):
+                @functools.wraps(fn)
+                async def _async(*args, **kwargs):
+                    with self.sure(ad):
+                        return await fn(*args, **kwargs)
+                return _async
+            @functools.wraps(fn)
+            def _sarili(*args, **kwargs):
+                with self.sure(ad):
+                    return fn(*args, **kwargs)
+            return _sarili
+        return dekorator
+
+    def _yuzdelik(self, h:List, oran:float) -> Optional[float]:
+        # kova üst sınırı (histogram çözünürlüğünde)
+        adet = sum(h[:-2])
+        if not adet: return None
+        hedef, birikim = oran * adet, 0
+        for j, n in enumerate(h[:-2]):
+            birikim += n
+            if birikim >= hedef:
+                return float(self.KOVALAR_MS[j]) if j < len(self.KOVALAR_MS) else round(h[-1], 2)
+        return round(h[-1], 2)
+
+    def ozet(self) -> Dict:
+        with self._kilit:
+            sayaclar = dict(self.sayaclar)
+            histogramlar = {ad: list(h) for ad, h in self.histogramlar.items()}
+            gecen = time.time() - self.t0
+        asamalar = {}
+        for ad, h in sorted(histogramlar.items(), key=lambda x: -x[1][-2]):
+            adet = sum(h[:-2])
+            asamalar[ad] = {'adet': adet, 'toplam_sn': round(h[-2] / 1000.0, 3), 'ort_ms': round(h[-2] / adet, 2) if adet else 0.0,
+                            'p50_ms': self._yuzdelik(h, 0.5), 'p95_ms': self._yuzdelik(h, 0.95), 'max_ms': round(h[-1], 2)}
+        return {'sure_sn': round(gecen, 3), 'sayaclar': dict(sorted(sayaclar.items())), 'asamalar': asamalar}
+
+    def prometheus(self, onek:str="site_bulucu") -> str:
+        def _ad(ad): return onek + "_" + re.sub(r'[^a-zA-Z0-9_]', '_', ad)
+        with self._kilit:
+            sayaclar = dict(self.sayaclar)
+            histogramlar = {ad: list(h) for ad, h in self.histogramlar.items()}
+        satirlar = []
+        for ad, n in sorted(sayaclar.items()):
+            m = _ad(ad) + "_total"
+            satirlar += [f"# TYPE {m} counter", f"{m} {n}"]
+        for ad, h in sorted(histogramlar.items()):
+            m = _ad(ad) + "_seconds"
+            satirlar.append(f"# TYPE {m} histogram")
+            birikim = 0
+            for ust, n in zip(self.KOVALAR_MS, h):
+                birikim += n
+                satirlar.append(f'{m}_bucket{{le="{ust / 1000.0:g}"}} {birikim}')
+            birikim += h[len(self.KOVALAR_MS)]
+            satirlar += [f'{m}_bucket{{le="+Inf"}} {birikim}', f"{m}_sum {h[-2] / 1000.0:.6f}", f"{m}_count {birikim}"]
+        return "\n".join(satirlar) + "\n"
+
+OLCUM = Olcum()
+
+def olcum_raporu(profil:bool=False, prom_dosyasi:Optional[str]=None):
+    """calistir_* sonunda: --profile ise JSON özeti yazdırır, --prom-file verilmişse textfile yazar."""
+    if profil:
+        print("⏱️ Profil:")
+        print(json.dumps(OLCUM.ozet(), ensure_ascii=False, indent=2))
+    if prom_dosyasi:
+        try:
+            _atomik_yaz(prom_dosyasi, OLCUM.prometheus().encode('utf-8'))
+        except Exception as e:
+            print(f"⚠️ Prometheus dosyası yazılamadı: {e}")
+
+# ===== Kayıt / tekrar oynatma (kaset) =====
+class Kaset:
+    """Ağ katmanı için kayıt/tekrar oynatma.
+
+    record: sarılı fonksiyonlar normal çalışır, dönüş değeri (fonksiyon adı + argümanlar) anahtarıyla kasete eklenir.
+    replay: değer kasetten döner, ağa hiç çıkılmaz; kasette olmayan çağrı "eksik" sayılır ve bulunamadı gibi davranır.
+    Mod yokken sarmalayıcı doğrudan asıl fonksiyonu çağırır.
+    Bellekte gövde tutulmaz: record modunda anahtar -> değer özeti (tekrar yazmamak için),
+    replay modunda anahtar -> dosya ofseti saklanır; değer gerektiğinde dosyadan okunur.
+    """
+    def __init__(self):
+        self.mod: Optional[str] = None
+        self.yol: Optional[str] = None
+        self._ozetler: Dict[str, bytes] = {}
+        self._konumlar: Dict[str, int] = {}
+        self._dosya = None
+        self._kilit = threading.Lock()
+        self.sayac = {'kayit': 0, 'tekrar': 0, 'eksik': 0}
+
+    @staticmethod
+    def _ozet(deger_json:str) -> bytes:
+        return hashlib.sha1(deger_json.encode('utf-8')).digest()
+
+    def ac(self, mod:Optional[str], yol:Optional[str]=None):
+        self.kapat()
+        self.mod, self.yol = mod, (yol or AYARLAR['KASET_DOSYASI'])
+        self._ozetler, self._konumlar = {}, {}
+        self.sayac = {'kayit': 0, 'tekrar': 0, 'eksik': 0}
+        if not mod: return
+        if os.path.exists(self.yol):
+            # dizin: her anahtarın son satırı geçerli
+            with open(self.yol, 'rb') as f:
+                konum = 0
+                for satir in f:
+                    try:
+                        kayit = json.loads(satir)
+                        if mod == 'replay':
+                            self._konumlar[kayit['k']] = konum
+                        else:
+                            self._ozetler[kayit['k']] = self._ozet(json.dumps(kayit['v'], ensure_ascii=False))
+                    except Exception:
+                        pass  # yarım kalmış son satır
+                    konum += len(satir)
+        elif mod == 'replay':
+            print(f"⚠️ Kaset bulunamadı: {self.yol} (tüm çağrılar eksik sayılacak)")
+        if mod == 'record':
+            self._dosya = open(self.yol, 'a', encoding='utf-8')
+        elif self._konumlar:
+            self._dosya = open(self.yol, 'rb')
+        atexit.register(self.kapat)
+
+    def kapat(self):
+        with self._kilit:
+            if self._dosya:
+                self._dosya.close()
+                self._dosya = None
+
+    @staticmethod
+    def anahtar(ad:str, args:tuple) -> str:
+        return json.dumps([ad, list(args)], ensure_ascii=False)
+
+    def _oku(self, k:str) -> Tuple[bool, object]:
+        with self._kilit:
+            konum = self._konumlar.get(k)
+            if konum is None or self._dosya is None:
+                self.sayac['eksik'] += 1
+                return False, None
+            self._dosya.seek(konum)
+            satir = self._dosya.readline()
+            self.sayac['tekrar'] += 1
+        return True, json.loads(satir)['v']
+
+    def _yaz(self, k:str, deger):
+        deger_json = json.dumps(deger, ensure_ascii=False)
+        ozet = self._ozet(deger_json)
+        with self._kilit:
+            if self._ozetler.get(k) == ozet:
+                return  # aynı yanıt zaten kasette
+            self._ozetler[k] = ozet
+            self.sayac['kayit'] += 1
+            if self._dosya:
+                self._dosya.write('{"k": ' + json.dumps(k, ensure_ascii=False) + ', "v": ' + deger_json + "}\n")
+                self._dosya.flush()
+
+    def sar(self, ad:str, arg_sayisi:int, eksik: Callable[[tuple], object]):
+        """Anahtar ilk `arg_sayisi` konumsal argümandan kurulur (timeout gibi ayarlar anahtara girmez)."""
+        def dekorator(fn):
+            @functools.wraps(fn)
+            def _sarili(*args, **kwargs):
+                if not self.mod:
+                    return fn(*args, **kwargs)
+                k = self.anahtar(ad, args[:arg_sayisi])
+                if self.mod == 'replay':
+                    var, deger = self._oku(k)
+                    return deger if var else eksik(args)
+                deger = fn(*args, **kwargs)
+                if ad == 'dns' and args[0] in _DNS_BELIRSIZ:
+                    return deger  # geçici hata: kaydetme, tekrar oynatmada da "bilinmiyor" kalsın
+                self._yaz(k, deger)
+                return deger
+            return _sarili
+        return dekorator
+
+    def istatistik(self) -> Dict:
+        return {'mod': self.mod, 'dosya': self.yol, 'kayit_sayisi': len(self._konumlar if self.mod == 'replay' else self._ozetler), **self.sayac}
+
+KASET = Kaset()
+
+def _dns_eksik(args):
+    _DNS_BELIRSIZ.add(args[0])  # kasette yok: NXDOMAIN değil, bilinmiyor
+    return []
+
+# ===== Çoklu anahtar kelime eşleştirici =====
+class CokluEslestirici:
+    """Birden çok anahtar kelime sınıfını tek geçişte arar.
+
+    Tüm kelimeler import anında önek ağacı (trie) biçiminde tek bir regex'e derlenir ve
+    `(?=(...))` ile her pozisyonda denenir; maliyet kelime sayısıyla değil metin boyuyla büyür.
+    Aynı pozisyonda en uzun eşleşme yakalanır, onun önek olan kısa kelimeleri de isabet sayılır;
+    sonuç her kelime için `kelime in metin` ile birebir aynıdır.
+    """
+    def __init__(self, siniflar: Dict[str, List[str]]):
+        self.siniflar = list(siniflar)
+        self._sinif: Dict[str, List[str]] = {}
+        for sinif, kelimeler in siniflar.items():
+            for k in kelimeler:
+                if k: self._sinif.setdefault(k, []).append(sinif)
+        self._onekler = {k: [p for p in self._sinif if k.startswith(p)] for k in self._sinif}
+        self._re = re.compile("(?=(" + self._trie_deseni(self._sinif) + "))") if self._sinif else None
+
+    @staticmethod
+    def _trie_deseni(kelimeler) -> str:
+        trie: Dict = {}
+        for k in kelimeler:
+            d = trie
+            for ch in k: d = d.setdefault(ch, {})
+            d[''] = {}
+        def _kur(d):
+            son = '' in d
+            dallar = [re.escape(ch) + _kur(alt) for ch, alt in sorted(d.items()) if ch != '']
+            if not dallar: return ''
+            if len(dallar) == 1 and not son: return dallar[0]
+            govde = "(?:" + "|".join(dallar) + ")"
+            return govde + "?" if son else govde
+        return _kur(trie)
+
+    def bul(self, metin: str) -> Dict[str, set]:
+        """dönüş: sınıf -> metinde geçen kelimeler kümesi"""
+        hits = {s: set() for s in self.siniflar}
+        if not self._re or not metin: return hits
+        gorulen = set()
+        for m in self._re.finditer(metin):
+            k = m.group(1)
+            if k in gorulen: continue
+            gorulen.add(k)
+            for p in self._onekler[k]:
+                for sinif in self._sinif[p]:
+                    hits[sinif].add(p)
+        return hits
+
+# Sayfa metni: park kalıpları + sektör sözlükleri + iller tek geçişte
+SAYFA_ESLESTIRICI = CokluEslestirici({
+    'parking': PARKING_KALIPLARI,
+    'il': TR_ILLER,
+    **{f"sozluk:{ad}": kelimeler for ad, kelimeler in AYARLAR['SEKTOR_SOZLUK'].items()},
+})
+PARK_ESLESTIRICI = CokluEslestirici({'parking': PARKING_KALIPLARI})
+NEGATIF_ESLESTIRICI = CokluEslestirici({'negatif': AYARLAR['NEGATIF_KELIMELER']})
+_IL_KUMESI = frozenset(TR_ILLER)
+_SEKTOR_KELIME_KUMESI = frozenset(AYARLAR['SEKTOR_KELIMELERI'])
+
+@functools.lru_cache(maxsize=4096)
+def _sektor_eslestirici(sektorler: Tuple[str, ...]) -> CokluEslestirici:
+    # firma başına sektör kümesi değişir; aynı küme için derleme bir kez yapılır
+    return CokluEslestirici({'sektor': list(sektorler)})
+
+def negatif_kelime_var(alan: str) -> bool:
+    return bool(NEGATIF_ESLESTIRICI.bul(alan)['negatif'])
+
 # ===== Yardımcılar =====
+# Not: str.translate CPython'da Türkçe karakterli uzun metinlerde zincir replace'ten ~70x yavaş
+_TR_CEVRIMLER = (('ı','i'), ('ğ','g'), ('ü','u'), ('ş','s'), ('ö','o'), ('ç','c'))
+# [^\w\s@.] -> ' ' ve ardından \s+ -> ' ' ile aynı sonuç: \w/@/. dışındaki her koşu tek boşluk olur
+_NORM_RE = re.compile(r'[^\w@\.]+')
+_IL_TOKEN_RE = re.compile(r'(?<!\S)(' + '|'.join(TR_ILLER) + r')(?!\S)')
+
 def metni_normallestir(metin: str) -> str:
     if not isinstance(metin, str): return ""
     metin = metin.lower()
-    cevrimler = {'ı':'i','ğ':'g','ü':'u','ş':'s','ö':'o','ç':'c'}
-    for e,y in cevrimler.items(): metin = metin.replace(e,y)
-    metin = re.sub(r'[^\w\s@\.]', ' ', metin)
-    return re.sub(r'\s+', ' ', metin).strip()
+    if not metin.isascii():
+        for e, y in _TR_CEVRIMLER: metin = metin.replace(e, y)
+    return _NORM_RE.sub(' ', metin).strip()
+
+@functools.lru_cache(maxsize=65536)
+def _kisa_normallestir(metin: str) -> str:
+    return metni_normallestir(metin)
+
+def kisa_metni_normallestir(metin: str) -> str:
+    """Firma adı, sektör, adres gibi tekrar eden kısa metinler için memoize edilmiş metni_normallestir."""
+    if isinstance(metin, str) and len(metin) <= 256:
+        return _kisa_normallestir(metin)
+    return metni_normallestir(metin)
+
+def normallestir_seri(seri: "pd.Series") -> "pd.Series":
+    """metni_normallestir'in sütun hali: her farklı değer bir kez normalize edilir (NaN/str olmayan -> "")."""
+    kodlar, tekiller = pd.factorize(seri, use_na_sentinel=True)
+    normlar = [metni_normallestir(v) for v in tekiller] + [""]  # -1 (NaN) -> ""
+    return pd.Series([normlar[k] for k in kodlar], index=seri.index, dtype=object)
 
 def slugify_firma(firma_adi: str) -> str:
-    return re.sub(r'[^a-z0-9]+', '-', metni_normallestir(firma_adi)).strip('-')
+    return re.sub(r'[^a-z0-9]+', '-', kisa_metni_normallestir(firma_adi)).strip('-')
 
 def alan_adini_ayikla(url: str) -> str:
     try:
@@ -168,20 +555,106 @@ def alan_adini_ayikla(url: str) -> str:
     except Exception:
         return ""
 
+# --- Public suffix trie ---
+# Düğüm: {etiket: alt_düğüm}; "" anahtarı kuralın burada bittiğini, "*" joker kuralı,
+# "!etiket" istisna kuralını gösterir. Etiketler sağdan sola (tr -> com -> ...) iner.
+_PSL_TRIE = None
+_PSL_KILIT = threading.Lock()
+
+def _psl_trie_kur(kurallar) -> Dict:
+    trie: Dict = {}
+    for kural in kurallar:
+        istisna = kural.startswith('!')
+        etiketler = kural.lstrip('!').split('.')[::-1]
+        dugum = trie
+        for e in (etiketler[:-1] if istisna else etiketler):
+            dugum = dugum.setdefault(e, {})
+        if istisna:
+            dugum['!' + etiketler[-1]] = 1
+        else:
+            dugum[''] = 1
+    return trie
+
+def _psl_kurallari(yol:str) -> List[str]:
+    kurallar = []
+    with open(yol, 'r', encoding='utf-8') as f:
+        for satir in f:
+            kural = satir.split()[0] if satir.strip() else ''
+            if not kural or kural.startswith('//'): continue
+            kural = kural.lower()
+            try:
+                # hostname'ler punycode gelir; IDN kurallarını da aynı biçime çevir
+                kural = '.'.join(e if e.isascii() else e.encode('idna').decode('ascii') for e in kural.split('.'))
+            except Exception:
+                continue
+            kurallar.append(kural)
+    return kurallar
+
+def _psl_trie() -> Dict:
+    """PSL trie'sini ilk kullanımda yükler: derlenmiş dosya güncelse ondan, değilse .dat'tan derleyip yazar."""
+    global _PSL_TRIE
+    if _PSL_TRIE is not None:
+        return _PSL_TRIE
+    with _PSL_KILIT:
+        if _PSL_TRIE is not None:
+            return _PSL_TRIE
+        kaynak, hedef = AYARLAR['PSL_DOSYASI'], AYARLAR['PSL_DERLENMIS']
+        try:
+            st = os.stat(kaynak)
+            imza = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            _PSL_TRIE = _psl_trie_kur(PUBLIC_SUFFIXES)
+            return _PSL_TRIE
+        trie = None
+        try:
+            with open(hedef, 'rb') as f:
+                kayitli_imza, kayitli = marshal.load(f)
+            if tuple(kayitli_imza) == imza:
+                trie = kayitli
+        except Exception:
+            pass
+        if trie is None:
+            try:
+                trie = _psl_trie_kur(_psl_kurallari(kaynak))
+            except Exception:
+                trie = _psl_trie_kur(PUBLIC_SUFFIXES)
+            else:
+                try:
+                    gecici = f"{hedef}.{os.getpid()}.tmp"
+                    with open(gecici, 'wb') as f:
+                        marshal.dump((imza, trie), f)
+                    os.replace(gecici, hedef)
+                except Exception:
+                    pass
+        _PSL_TRIE = trie
+        return trie
+
+@functools.lru_cache(maxsize=65536)
 def _registrable_domain_parts(domain: str) -> Tuple[str, str]:
     # Dönen: (second_level, suffix)
-    # Çok parçalı suffix'leri göz önüne al
+    # Public suffix trie'sinde en uzun eşleşen kural (joker ve istisna kuralları dahil)
     parts = domain.split('.')
     if len(parts) < 2:
         return domain, ''
-    # En uzun eşleşen public suffix'i bul
-    for i in range(len(parts)-1):
-        suffix = '.'.join(parts[i:])
-        if suffix in PUBLIC_SUFFIXES:
-            second = parts[i-1] if i-1 >= 0 else parts[0]
-            return second, suffix
-    # Default: son 2 parça
-    return parts[-2], parts[-1]
+    dugum = _psl_trie()
+    n = 1  # varsayılan kural "*": son etiket
+    for i in range(len(parts) - 1, -1, -1):
+        etiket = parts[i]
+        derinlik = len(parts) - i
+        if '!' + etiket in dugum:
+            n = derinlik - 1
+            break
+        if '*' in dugum:
+            n = max(n, derinlik)
+        dugum = dugum.get(etiket) if etiket else None
+        if not isinstance(dugum, dict):
+            break
+        if '' in dugum:
+            n = max(n, derinlik)
+    if n >= len(parts):
+        # domain'in kendisi public suffix (ör. com.tr)
+        return parts[0], domain
+    return parts[-n-1], '.'.join(parts[-n:])
 
 def alan_kok(alan: str) -> str:
     second, _sfx = _registrable_domain_parts(alan)
@@ -189,12 +662,12 @@ def alan_kok(alan: str) -> str:
 
 def adresten_ili_al(adres: str) -> str:
     if not adres or not isinstance(adres, str): return ""
-    norm = metni_normallestir(adres)
+    norm = kisa_metni_normallestir(adres)
     toks = norm.replace(",", " ").split()
     # Metin içinde geçen son şehir adını döndür
     last_city = ""
     for t in toks:
-        if t in TR_ILLER:
+        if t in _IL_KUMESI:
             last_city = t
     return last_city
 
@@ -220,91 +693,415 @@ def marka_cekirdegi_bilesik(tokens: List[str]) -> Tuple[str,str]:
 MERSIS_RE = re.compile(r'\b\d{16}\b')
 VERGI_RE  = re.compile(r'\b\d{10}\b')
 SICIL_RE  = re.compile(r'(sicil|ticaret sicil)\s*no[:\s]*([A-Za-z0-9\-\/]+)', re.I)
-
-def extract_legal_ids(full_text:str):
-    mersis = MERSIS_RE.findall(full_text)
-    vergi  = VERGI_RE.findall(full_text)
-    sicil  = [m[1] for m in SICIL_RE.findall(full_text)]
-    return {"mersis": mersis[:1], "vergi": vergi[:1], "sicil": sicil[:1]}
-
-def extract_city_from_text(full_text:str, known_cities:List[str]) -> Optional[str]:
-    for city in known_cities:
-        if city and city in full_text:
-            return city
-    return None
+MAIL_DOM_RE = re.compile(r'[a-z0-9\._%+-]+@([a-z0-9\.-]+\.[a-z]{2,})')
+TEL_RE    = re.compile(r'\b0\s?\d{3}\s?\d{3}\s?\d{2}\s?\d{2}\b')
+TEL_INTL_RE = re.compile(r'\+\d{2}\s?\d{3}\s?\d{3}\s?\d{2}\s?\d{2}')
 
 def is_parked_page(html_norm: str) -> bool:
-    return any(pat in html_norm for pat in PARKING_KALIPLARI)
+    return bool(PARK_ESLESTIRICI.bul(html_norm)['parking'])
 
 # ===== DNS & SSL =====
+class _Gecici(Exception):
+    """hesapla() bunu fırlatırsa değer döner ama memo'ya yazılmaz (zaman aşımı gibi geçici sonuç)."""
+    def __init__(self, deger=None):
+        super().__init__()
+        self.deger = deger
+
+class _Memo:
+    """Süreç içi memo; aynı anahtar için eşzamanlı ikinci çağrı ilkinin sonucunu bekler."""
+    def __init__(self):
+        self._d: Dict = {}
+        self._ucusta: Dict = {}
+        self._kilit = threading.Lock()
+
+    def al(self, anahtar, hesapla):
+        with self._kilit:
+            if anahtar in self._d:
+                return self._d[anahtar]
+            ev = self._ucusta.get(anahtar)
+            sahip = ev is None
+            if sahip:
+                ev = self._ucusta[anahtar] = threading.Event()
+        if not sahip:
+            ev.wait()
+            with self._kilit:
+                if anahtar in self._d:
+                    return self._d[anahtar]
+            try:
+                return hesapla()
+            except _Gecici as e:
+                return e.deger
+        try:
+            deger = hesapla()
+            with self._kilit:
+                self._d[anahtar] = deger
+            return deger
+        except _Gecici as e:
+            return e.deger
+        finally:
+            with self._kilit:
+                self._ucusta.pop(anahtar, None)
+            ev.set()
+
+_DNS_MEMO = _Memo()
+_CERT_MEMO = _Memo()
+# getaddrinfo'nun zaman aşımı parametresi yok; global socket timeout'a dokunmak yerine ayrı havuzda bekle
+_DNS_EX = ThreadPoolExecutor(max_workers=32, thread_name_prefix="dns")
+_DNS_KUYRUK_BEKLEME = 30.0  # sn; havuz doluyken çözümlemenin başlamasını en fazla bu kadar bekle
+
+# zaman aşımı / geçici DNS hatası alan domainler: sonuç bilinmiyor (NXDOMAIN sayılmaz)
+_DNS_BELIRSIZ = set()
+
+@KASET.sar('dns', 1, _dns_eksik)
+def dns_kaydi(domain: str, timeout: float = 2.0) -> List[str]:
+    """Domain'in çözülen adresleri (yoksa []). Bellekte ve SQLite'ta TTL ile cache'lenir."""
+    if not domain: return []
+    def _hesapla():
+        cached = CACHE.get_kv('dns_cache', domain)
+        if cached is not None:
+            return json.loads(cached)
+        basladi = threading.Event()
+        def _coz():
+            basladi.set()
+            return socket.getaddrinfo(domain, None)
+        try:
+            fut = _DNS_EX.submit(_coz)
+            # zaman aşımı kuyrukta değil, getaddrinfo başladığında işlemeye başlar
+            if not basladi.wait(_DNS_KUYRUK_BEKLEME):
+                raise TimeoutError("dns kuyruğu")
+            infos = fut.result(timeout=timeout)
+            adresler = sorted({info[4][0] for info in infos})
+        except socket.gaierror as e:
+            if e.errno != getattr(socket, 'EAI_NONAME', None):
+                _DNS_BELIRSIZ.add(domain)
+                raise _Gecici([])  # EAI_AGAIN / EAI_FAIL / EAI_NODATA: kesin değil, kalıcı yazma
+            adresler = []  # NXDOMAIN
+        except Exception:
+            _DNS_BELIRSIZ.add(domain)
+            raise _Gecici([])  # zaman aşımı vb.: kalıcı yazma, memo'ya da yazma (sonraki çağrı tekrar dener)
+        CACHE.set_kv('dns_cache', domain, json.dumps(adresler))
+        return adresler
+    return _DNS_MEMO.al(domain, _hesapla)
+
+@KASET.sar('ssl', 1, lambda args: None)
+def sertifika_adlari(domain: str, timeout: float = 3.0) -> Optional[List[str]]:
+    """Sertifikadaki subject + DNS SAN değerleri (normalize). TLS kurulamazsa None."""
+    if not domain: return None
+    def _hesapla():
+        cached = CACHE.get_kv('cert_cache', domain)
+        if cached is not None:
+            return json.loads(cached)
+        try:
+            ctx = ssl.create_default_context()
+            with socket.create_connection((domain, 443), timeout=timeout) as sock:
+                with ctx.wrap_socket(sock, server_hostname=domain) as ssock:
+                    cert = ssock.getpeercert()
+            texts = []
+            for t in cert.get('subject', ()):
+                for k, v in t:
+                    if isinstance(v, str):
+                        texts.append(kisa_metni_normallestir(v))
+            # SAN alanları
+            for typ, val in cert.get('subjectAltName', ()):
+                if typ.lower() == 'dns' and isinstance(val, str):
+                    texts.append(kisa_metni_normallestir(val))
+        except (ssl.SSLEOFError, ssl.SSLZeroReturnError):
+            raise _Gecici(None)  # el sıkışma yarıda kesildi: geçici olabilir, kalıcı yazma
+        except (ssl.SSLError, ConnectionRefusedError):
+            texts = None  # doğrulama hatası / 443 kapalı: kesin sonuç
+        except socket.gaierror as e:
+            if e.errno != getattr(socket, 'EAI_NONAME', None):
+                raise _Gecici(None)  # geçici çözümleme hatası
+            texts = None
+        except OSError:
+            raise _Gecici(None)  # zaman aşımı, reset, ağ erişilemez vb.: kalıcı yazma
+        except Exception:
+            texts = None
+        CACHE.set_kv('cert_cache', domain, json.dumps(texts))
+        return texts
+    return _CERT_MEMO.al(domain, _hesapla)
+
+@OLCUM.olculen('dns')
 def has_dns_a_record(domain: str, timeout: float = 2.0) -> bool:
-    try:
-        socket.setdefaulttimeout(timeout)
-        socket.getaddrinfo(domain, None)
-        return True
-    except Exception:
-        return False
+    return bool(dns_kaydi(domain, timeout))
 
+@OLCUM.olculen('ssl')
 def ssl_cn_matches(domain: str, core_tokens: List[str], timeout: float = 3.0) -> bool:
-    try:
-        ctx = ssl.create_default_context()
-        with socket.create_connection((domain, 443), timeout=timeout) as sock:
-            with ctx.wrap_socket(sock, server_hostname=domain) as ssock:
-                cert = ssock.getpeercert()
-        subj = cert.get('subject', ())
-        texts = []
-        for t in subj:
-            for k, v in t:
-                if isinstance(v, str):
-                    texts.append(metni_normallestir(v))
-        # SAN alanları
-        san = cert.get('subjectAltName', ())
-        for typ, val in san:
-            if typ.lower() == 'dns' and isinstance(val, str):
-                texts.append(metni_normallestir(val))
-        cn_text = " ".join(texts)
-        join = "".join(core_tokens)
-        return bool(join) and (join in cn_text)
-    except Exception:
-        return False
+    adlar = sertifika_adlari(domain, timeout)
+    if not adlar: return False
+    cn_text = " ".join(adlar)
+    join = "".join(core_tokens)
+    return bool(join) and (join in cn_text)
 
-# ===== Basit SQLite Cache =====
+# ===== SQLite Cache (WAL + write-behind) =====
 class Cache:
-    def __init__(self, path:str):
-        self.db = sqlite3.connect(path)
+    """Thread-safe SQLite cache.
+
+    Okumalar thread başına ayrı bağlantıdan yapılır (WAL sayesinde commit beklemez);
+    yazmalar kuyruğa atılır ve tek yazıcı thread tarafından paketler halinde commit edilir.
+    Henüz commit edilmemiş kayıtlar bellekte tutulur, böylece yazan thread kendi kaydını hemen okur.
+    HTML gövdeleri sıkıştırılmış BLOB olarak saklanır; eski TEXT kayıtlar olduğu gibi okunur.
+    TTL'i geçmiş kayıt okunmaz; boyut bütçesi aşılınca en eski ts'li url_cache kayıtları silinir.
+    feature_store (firma, url, sürüm) -> özellik vektörü tablosu TTL'siz ve kalıcıdır.
+    """
+    # (anahtar, deger, ts) biçimli basit tablolar
+    KV_TABLOLARI = ('dns_cache', 'cert_cache', 'sig_cache')
+
+    def __init__(self, path:str, paket:int=256, aralik:float=1.0, ttl:Optional[Dict[str,Optional[float]]]=None,
+                 sikistirma:Optional[str]='zlib', max_mb:Optional[float]=None, temizlik_araligi:int=1000):
+        self.path = path
+        self.paket = paket
+        self.aralik = aralik
+        self.ttl = dict(ttl or {})
+        self.sikistirma = sikistirma
+        self.max_bayt = int(max_mb * 1024 * 1024) if max_mb else None
+        self.temizlik_araligi = temizlik_araligi
+        self.sayac: Dict[str, Dict[str,int]] = {}
+        self.ham_bayt = 0
+        self.saklanan_bayt = 0
+        self._yerel = threading.local()
+        self._kuyruk = queue.Queue()
+        self._bekleyen: Dict[Tuple[str,str], object] = {}
+        self._kilit = threading.Lock()
         self._init()
+        self._yazici = threading.Thread(target=self._yaz_dongusu, name="cache-writer", daemon=True)
+        self._yazici.start()
+        atexit.register(self.close)
+
     def _init(self):
-        cur = self.db.cursor()
+        db = sqlite3.connect(self.path, timeout=30)
+        db.execute("PRAGMA journal_mode=WAL")
+        cur = db.cursor()
         cur.execute("CREATE TABLE IF NOT EXISTS url_cache (url TEXT PRIMARY KEY, html TEXT, ts REAL)")
         cur.execute("CREATE TABLE IF NOT EXISTS query_cache (q TEXT PRIMARY KEY, results TEXT, ts REAL)")
-        self.db.commit()
+        try:
+            cur.execute("ALTER TABLE url_cache ADD COLUMN boyut INTEGER")  # sıkıştırılmamış bayt
+        except sqlite3.OperationalError:
+            pass
+        cur.execute("CREATE INDEX IF NOT EXISTS url_cache_ts ON url_cache(ts)")
+        cur.execute("CREATE INDEX IF NOT EXISTS query_cache_ts ON query_cache(ts)")
+        cur.execute("CREATE TABLE IF NOT EXISTS neg_cache (anahtar TEXT PRIMARY KEY, neden TEXT, ts REAL)")
+        for tablo in self.KV_TABLOLARI:
+            cur.execute(f"CREATE TABLE IF NOT EXISTS {tablo} (anahtar TEXT PRIMARY KEY, deger TEXT, ts REAL)")
+        cur.execute("CREATE TABLE IF NOT EXISTS feature_store (firma TEXT, url TEXT, surum INTEGER, ozellik TEXT, ts REAL, "
+                    "PRIMARY KEY(firma, url, surum))")
+        db.commit()
+        db.close()
+
+    def _db(self) -> sqlite3.Connection:
+        db = getattr(self._yerel, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._yerel.db = db
+        return db
+
+    def _say(self, tablo:str, olay:str):
+        with self._kilit:
+            t = self.sayac.setdefault(tablo, {'hit': 0, 'miss': 0, 'expired': 0})
+            t[olay] += 1
+
+    def _oku(self, tablo:str, anahtar:str, sql:str):
+        # sql: (deger, ts) döndürmeli
+        with self._kilit:
+            if (tablo, anahtar) in self._bekleyen:
+                deger = self._bekleyen[(tablo, anahtar)]
+                self.sayac.setdefault(tablo, {'hit': 0, 'miss': 0, 'expired': 0})['hit'] += 1
+                return deger
+        row = self._db().execute(sql, (anahtar,)).fetchone()
+        if not row:
+            self._say(tablo, 'miss'); return None
+        ttl = self.ttl.get(tablo)
+        if ttl and (row[1] or 0) < time.time() - ttl:
+            self._say(tablo, 'expired'); return None
+        self._say(tablo, 'hit')
+        return row[0]
+
+    def _yaz(self, tablo:str, anahtar:str, deger, sql:str, params:tuple):
+        with self._kilit:
+            self._bekleyen[(tablo, anahtar)] = deger
+        self._kuyruk.put((tablo, anahtar, deger, sql, params))
+
+    def _sikistir(self, metin:str):
+        ham = metin.encode('utf-8')
+        if self.sikistirma == 'zstd' and zstandard is not None:
+            return b'S' + zstandard.ZstdCompressor(level=3).compress(ham)
+        if self.sikistirma in ('zlib', 'zstd'):
+            return b'Z' + zlib.compress(ham, 6)
+        return metin
+
+    @staticmethod
+    def _ac(deger) -> str:
+        if isinstance(deger, bytes):
+            if deger[:1] == b'Z': return zlib.decompress(deger[1:]).decode('utf-8')
+            if deger[:1] == b'S' and zstandard is not None:
+                return zstandard.ZstdDecompressor().decompress(deger[1:]).decode('utf-8')
+            return deger.decode('utf-8', 'replace')
+        return deger
+
+    def _temizle(self, db:sqlite3.Connection):
+        simdi = time.time()
+        with db:
+            for tablo, ttl in self.ttl.items():
+                if ttl:
+                    db.execute(f"DELETE FROM {tablo} WHERE ts < ?", (simdi - ttl,))
+        if not self.max_bayt: return
+        sayfa_boyu = db.execute("PRAGMA page_size").fetchone()[0]
+        while True:
+            dolu = db.execute("PRAGMA page_count").fetchone()[0] - db.execute("PRAGMA freelist_count").fetchone()[0]
+            if dolu * sayfa_boyu <= self.max_bayt: break
+            with db:
+                n = db.execute("DELETE FROM url_cache WHERE url IN (SELECT url FROM url_cache ORDER BY ts LIMIT 200)").rowcount
+            if not n: break
+
+    def _yaz_dongusu(self):
+        db = sqlite3.connect(self.path, timeout=30)
+        db.execute("PRAGMA synchronous=NORMAL")
+        yazilan = 0
+        try:
+            self._temizle(db)
+        except Exception:
+            pass
+        dur = False
+        while not dur:
+            paket = [self._kuyruk.get()]
+            son = time.time() + self.aralik
+            while len(paket) < self.paket and isinstance(paket[-1], tuple):
+                try:
+                    paket.append(self._kuyruk.get(timeout=max(0.0, son - time.time())))
+                except queue.Empty:
+                    break
+            kayitlar = [k for k in paket if isinstance(k, tuple)]
+            if kayitlar:
+                try:
+                    with db:
+                        for _t, _a, _d, sql, params in kayitlar:
+                            db.execute(sql, params)
+                except Exception as e:
+                    # paket geri alındı: tek bozuk kayıt yüzünden diğerleri kaybolmasın, tek tek yeniden dene
+                    hatali = 0
+                    for _t, _a, _d, sql, params in kayitlar:
+                        try:
+                            with db:
+                                db.execute(sql, params)
+                        except Exception:
+                            hatali += 1
+                    print(f"⚠️ Cache yazma hatası ({e}); {len(kayitlar)} kaydın {hatali} tanesi yazılamadı.")
+                with self._kilit:
+                    for tablo, anahtar, deger, _sql, _p in kayitlar:
+                        if self._bekleyen.get((tablo, anahtar)) is deger:
+                            del self._bekleyen[(tablo, anahtar)]
+                yazilan += len(kayitlar)
+                if yazilan >= self.temizlik_araligi:
+                    yazilan = 0
+                    try:
+                        self._temizle(db)
+                    except Exception:
+                        pass
+            for k in paket:
+                if k is None:
+                    dur = True
+                elif isinstance(k, threading.Event):
+                    k.set()
+        db.close()
+
+    def flush(self, timeout:float=30.0):
+        """Kuyruktaki tüm yazmalar commit edilene kadar bekle."""
+        if not self._yazici.is_alive(): return
+        ev = threading.Event()
+        self._kuyruk.put(ev)
+        ev.wait(timeout)
+
+    def close(self):
+        if self._yazici.is_alive():
+            self._kuyruk.put(None)
+            self._yazici.join(timeout=30)
+
+    def istatistik(self) -> Dict:
+        """Bu süreçteki hit oranı + veritabanı boyutu ve sıkıştırma kazancı."""
+        self.flush()
+        db = self._db()
+        with self._kilit:
+            tablolar = {t: dict(c) for t, c in self.sayac.items()}
+            ham, saklanan = self.ham_bayt, self.saklanan_bayt
+        for t, c in tablolar.items():
+            toplam = c['hit'] + c['miss'] + c['expired']
+            c['hit_orani'] = round(c['hit'] / toplam, 4) if toplam else 0.0
+        kayit, db_ham, db_saklanan = db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(COALESCE(boyut, LENGTH(html))),0), COALESCE(SUM(LENGTH(html)),0) FROM url_cache").fetchone()
+        return {
+            'oturum': {'tablolar': tablolar, 'yazilan_ham_bayt': ham, 'yazilan_saklanan_bayt': saklanan,
+                       'kazanilan_bayt': ham - saklanan},
+            'veritabani': {'dosya_bayt': sum(os.path.getsize(f) for f in (self.path, self.path + '-wal') if os.path.exists(f)),
+                           'url_kayit': kayit,
+                           'query_kayit': db.execute("SELECT COUNT(*) FROM query_cache").fetchone()[0],
+                           'html_ham_bayt': db_ham, 'html_saklanan_bayt': db_saklanan,
+                           'kazanilan_bayt': db_ham - db_saklanan},
+        }
+
     def get_html(self, url:str) -> Optional[str]:
-        cur = self.db.cursor()
-        cur.execute("SELECT html FROM url_cache WHERE url=?", (url,))
-        row = cur.fetchone()
-        return row[0] if row else None
+        return self._ac(self._oku('url_cache', url, "SELECT html, ts FROM url_cache WHERE url=?"))
     def set_html(self, url:str, html_text:str):
-        cur = self.db.cursor()
-        cur.execute("REPLACE INTO url_cache(url, html, ts) VALUES(?,?,?)", (url, html_text, time.time()))
-        self.db.commit()
+        saklanan = self._sikistir(html_text)
+        ham_boy = len(html_text.encode('utf-8'))
+        with self._kilit:
+            self.ham_bayt += ham_boy
+            self.saklanan_bayt += len(saklanan)
+        self._yaz('url_cache', url, html_text,
+                  "REPLACE INTO url_cache(url, html, ts, boyut) VALUES(?,?,?,?)", (url, saklanan, time.time(), ham_boy))
     def get_results(self, q:str) -> Optional[List[str]]:
-        cur = self.db.cursor()
-        cur.execute("SELECT results FROM query_cache WHERE q=?", (q,))
-        row = cur.fetchone()
-        if not row: return None
-        return row[0].split('\n')
+        val = self._oku('query_cache', q, "SELECT results, ts FROM query_cache WHERE q=?")
+        if val is None: return None
+        return val.split('\n') if val else []
     def set_results(self, q:str, results:List[str]):
-        cur = self.db.cursor()
-        cur.execute("REPLACE INTO query_cache(q, results, ts) VALUES(?,?,?)", (q, '\n'.join(results), time.time()))
-        self.db.commit()
-
-CACHE = Cache(AYARLAR['CACHE_DB'])
+        val = '\n'.join(results)
+        self._yaz('query_cache', q, val,
+                  "REPLACE INTO query_cache(q, results, ts) VALUES(?,?,?)", (q, val, time.time()))
+    def get_kv(self, tablo:str, anahtar:str) -> Optional[str]:
+        return self._oku(tablo, anahtar, f"SELECT deger, ts FROM {tablo} WHERE anahtar=?")
+    def set_kv(self, tablo:str, anahtar:str, deger:str):
+        self._yaz(tablo, anahtar, deger,
+                  f"REPLACE INTO {tablo}(anahtar, deger, ts) VALUES(?,?,?)", (anahtar, deger, time.time()))
+    def get_neg(self, anahtar:str) -> Optional[str]:
+        return self._oku('neg_cache', anahtar, "SELECT neden, ts FROM neg_cache WHERE anahtar=?")
+    def set_neg(self, anahtar:str, neden:str):
+        self._yaz('neg_cache', anahtar, neden,
+                  "REPLACE INTO neg_cache(anahtar, neden, ts) VALUES(?,?,?)", (anahtar, neden, time.time()))
+    def get_features(self, firma:str, url:str, surum:int) -> Optional[List[float]]:
+        anahtar = (firma, url, surum)
+        with self._kilit:
+            deger = self._bekleyen.get(('feature_store', anahtar))
+        if deger is None:
+            row = self._db().execute("SELECT ozellik FROM feature_store WHERE firma=? AND url=? AND surum=?", anahtar).fetchone()
+            deger = row[0] if row else None
+        self._say('feature_store', 'miss' if deger is None else 'hit')
+        return json.loads(deger) if deger is not None else None
+    def set_features(self, firma:str, url:str, surum:int, feats:List[float]):
+        deger = json.dumps(feats)
+        self._yaz('feature_store', (firma, url, surum), deger,
+                  "REPLACE INTO feature_store(firma, url, surum, ozellik, ts) VALUES(?,?,?,?,?)",
+                  (firma, url, surum, deger, time.time()))
+
+CACHE = Cache(AYARLAR['CACHE_DB'], AYARLAR['CACHE_YAZ_PAKET'], AYARLAR['CACHE_YAZ_ARALIK'],
+              ttl=AYARLAR['CACHE_TTL'], sikistirma=AYARLAR['CACHE_SIKISTIRMA'],
+              max_mb=AYARLAR['CACHE_MAX_MB'], temizlik_araligi=AYARLAR['CACHE_TEMIZLIK_ARALIGI'])
 
 # ===== HTTP Session + Retry =====
 SESSION = requests.Session()
+# yeni_baglanti: açılan TCP/TLS bağlantısı; istek: gönderilen istek (fark = keep-alive ile yeniden kullanım)
+# atilan_baglanti: havuz dolu olduğu için kapatılan bağlantı ("connection pool is full, discarding connection")
+HAVUZ_SAYAC = {'istek': 0, 'yeni_baglanti': 0, 'atilan_baglanti': 0}
+HAVUZ_AYARI: Dict[str, int] = {}
+_HAVUZ_KILIT = threading.Lock()
+
+def _havuz_say(anahtar:str):
+    with _HAVUZ_KILIT:
+        HAVUZ_SAYAC[anahtar] += 1
+
 try:
     from urllib3.util.retry import Retry
     from requests.adapters import HTTPAdapter
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+    from urllib3.connection import HTTPConnection
     retries = Retry(
         total=3,
         backoff_factor=0.5,
@@ -312,40 +1109,203 @@ try:
         allowed_methods=["GET"],
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retries)
+
+    class _SayacliHavuz:
+        # urllib3 havuzlarına eklenen sayaçlar (HAVUZ_SAYAC)
+        def _new_conn(self):
+            _havuz_say('yeni_baglanti')
+            return super()._new_conn()
+        def _make_request(self, *args, **kwargs):
+            _havuz_say('istek')
+            return super()._make_request(*args, **kwargs)
+        def _put_conn(self, conn):
+            if conn is not None and self.pool is not None and self.pool.full():
+                _havuz_say('atilan_baglanti')
+            return super()._put_conn(conn)
+
+    class _SayacliHTTPHavuz(_SayacliHavuz, HTTPConnectionPool): pass
+    class _SayacliHTTPSHavuz(_SayacliHavuz, HTTPSConnectionPool): pass
+
+    class _HavuzAdaptoru(HTTPAdapter):
+        def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+            if AYARLAR['HTTP_KEEPALIVE']:
+                pool_kwargs.setdefault('socket_options', HTTPConnection.default_socket_options +
+                                       [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)])
+            super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+            self.poolmanager.pool_classes_by_scheme = {'http': _SayacliHTTPHavuz, 'https': _SayacliHTTPSHavuz}
+except Exception:
+    _HavuzAdaptoru = None
+
+def http_havuzunu_ayarla(workers:int=1, engine:str="thread") -> Dict[str, int]:
+    """Oturum adaptörünü eşzamanlılığa göre boyutlandırıp yeniden bağlar.
+
+    Host başına en kalabalık hedef arama motorudur (firma başına paralel sorgular × işçi);
+    async motorda host semaforu zaten ASYNC_HOST_BASINA ile sınırlar.
+    """
+    if engine == "async":
+        host = AYARLAR['ASYNC_HOST_BASINA']
+        toplam = AYARLAR['ASYNC_MAX_INFLIGHT']
+    else:
+        sorgu = max(len(AYARLAR['ARAMA_SORGULARI']), 4)  # sosyal aramalar 4 thread'le
+        host = max(workers * sorgu, AYARLAR['DEEP_MAX_SAYFA'] + 1)
+        toplam = workers * max(AYARLAR['REVIEW_DALGA'], AYARLAR['DEEP_MAX_SAYFA'] + 1) + 2
+    host = AYARLAR['HTTP_HOST_BAGLANTI'] or host
+    toplam = AYARLAR['HTTP_HAVUZ_SAYISI'] or max(toplam, 10)
+    if _HavuzAdaptoru is None:
+        return {}
+    adapter = _HavuzAdaptoru(pool_connections=toplam, pool_maxsize=host, max_retries=retries)
     SESSION.mount('http://', adapter)
     SESSION.mount('https://', adapter)
-except Exception:
-    pass
+    HAVUZ_AYARI.update(havuz_sayisi=toplam, host_baglanti=host)
+    return dict(HAVUZ_AYARI)
+
+def havuz_istatistik() -> Dict[str, int]:
+    with _HAVUZ_KILIT:
+        sayac = dict(HAVUZ_SAYAC)
+    sayac['yeniden_kullanim'] = max(0, sayac['istek'] - sayac['yeni_baglanti'])
+    sayac['yeniden_kullanim_orani'] = round(sayac['yeniden_kullanim'] / sayac['istek'], 4) if sayac['istek'] else 0.0
+    return {**sayac, **HAVUZ_AYARI}
+
+http_havuzunu_ayarla()
 
 # ===== HTTP yardımcı =====
+# Negatif cache anahtarları:
+#   host:<alan>            DNS yok -> host'un tüm URL'leri atlanır
+#   host:<şema>://<alan>   bağlantı reddi / zaman aşımı / TLS hatası -> o şemadaki tüm URL'ler atlanır
+#   url:<url>              HTTP 4xx/5xx, HTML olmayan içerik türü -> sadece o URL atlanır (aynı sitenin diğer sayfaları denenir)
+def _neg_anahtarlari(url:str) -> List[str]:
+    alan = alan_adini_ayikla(url)
+    sema = urlparse(url).scheme
+    return [f"host:{alan}", f"host:{sema}://{alan}", f"url:{url}"]
+
+# urllib3 2.x tüm çözümleme hatalarını NameResolutionError'a sarar; kalıcı/geçici ayrımı alttaki gaierror metninden
+_DNS_KALICI = ("Name or service not known", "nodename nor servname", "No address associated", "getaddrinfo failed", "Errno -2]", "Errno 11001]")
+_DNS_GECICI = ("Temporary failure in name resolution", "Errno -3]", "Errno 11002]")
+
+def _hata_siniflandir(url:str, e:Exception) -> Tuple[Optional[str], str, bool]:
+    """dönüş: (neg_anahtar, neden, host_duzeyi); neg_anahtar None ise hata geçicidir, negatif cache'e yazılmaz."""
+    alan = alan_adini_ayikla(url)
+    sema = urlparse(url).scheme
+    if isinstance(e, _IcerikReddi):
+        return f"url:{url}", e.neden, False
+    if isinstance(e, requests.HTTPError):
+        kod = e.response.status_code if e.response is not None else 0
+        return f"url:{url}", f"http-{kod}", False
+    if isinstance(e, requests.exceptions.SSLError):
+        return f"host:{sema}://{alan}", "ssl", True
+    if isinstance(e, requests.Timeout):
+        return f"host:{sema}://{alan}", "timeout", True
+    if isinstance(e, requests.ConnectionError):
+        msg = str(e)
+        if any(k in msg for k in _DNS_GECICI):
+            return None, "dns-gecici", True  # resolver aksaması: alan adını saatlerce ölü sayma
+        if any(k in msg for k in _DNS_KALICI):
+            return f"host:{alan}", "dns", True  # NXDOMAIN / EAI_NONAME
+        if "NameResolutionError" in msg or "Failed to resolve" in msg:
+            return None, "dns-gecici", True  # nedeni belirsiz çözümleme hatası: kalıcı sayma
+        if "refused" in msg.lower():
+            return f"host:{sema}://{alan}", "refused", True
+        return f"host:{sema}://{alan}", "baglanti", True
+    return f"url:{url}", "hata", False
+
+class _IcerikReddi(Exception):
+    """Gövde okunmadan reddedilen yanıt (HTML olmayan içerik türü)."""
+    def __init__(self, neden:str):
+        super().__init__(neden)
+        self.neden = neden
+
+_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w\-:.]+)', re.I)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w\-:.]+)', re.I)
+
+def _yanit_metni(r) -> str:
+    """stream=True yanıtı okur: içerik türü başlıktan kontrol edilir, gövde MAX_SAYFA_BAYT'ta kesilir.
+
+    Çözme sırası: Content-Type charset'i, ilk 4KB'taki <meta charset>, utf-8 (hatalı bayt -> \ufffd).
+    """
+    ctype = r.headers.get('Content-Type') or ''
+    tur = ctype.split(';')[0].strip().lower()
+    if tur and tur not in AYARLAR['KABUL_EDILEN_ICERIK']:
+        raise _IcerikReddi(f"tur:{tur}")
+    sinir = AYARLAR['MAX_SAYFA_BAYT']
+    parcalar, n = [], 0
+    for parca in r.iter_content(chunk_size=65536):
+        parcalar.append(parca)
+        n += len(parca)
+        if sinir and n >= sinir: break
+    govde = b''.join(parcalar)
+    if sinir: govde = govde[:sinir]
+    m = _CHARSET_RE.search(ctype)
+    kod = m.group(1) if m else None
+    if not kod:
+        m = _META_CHARSET_RE.search(govde[:4096])
+        kod = m.group(1).decode('ascii', 'ignore') if m else None
+    try:
+        return govde.decode(kod or 'utf-8', errors='replace')
+    except LookupError:
+        return govde.decode('utf-8', errors='replace')
+
+def _sayfa_getir(url:str, timeout:float) -> Tuple[str, str]:
+    """dönüş: (son_url, metin); bağlantı her durumda havuza bırakılır/kapatılır."""
+    r = SESSION.get(url, headers=headers(), timeout=timeout, allow_redirects=True, stream=True)
+    try:
+        r.raise_for_status()
+        return r.url, _yanit_metni(r)
+    finally:
+        r.close()
+
+def olu_mu(url:str) -> Optional[str]:
+    """URL ya da host'u negatif cache'te ise nedeni döner."""
+    for anahtar in _neg_anahtarlari(url):
+        neden = CACHE.get_neg(anahtar)
+        if neden is not None:
+            return neden
+    return None
+
+@KASET.sar('fetch', 1, lambda args: None)
 def fetch(url:str, timeout:int) -> Optional[str]:
     cached = CACHE.get_html(url)
     if cached is not None:
+        OLCUM.say('fetch.cache_hit')
         return cached
+    if olu_mu(url) is not None:
+        OLCUM.say('fetch.neg_cache')
+        return None
+    OLCUM.say('fetch.ag')
+    with OLCUM.sure('fetch.ag'):
+        html_text = _fetch_ag(url, timeout)
+    if html_text is None:
+        OLCUM.say('fetch.basarisiz')
+    return html_text
+
+def _fetch_ag(url:str, timeout:int) -> Optional[str]:
     try:
-        r = SESSION.get(url, headers=headers(), timeout=timeout, allow_redirects=True)
-        r.raise_for_status()
-        html_text = r.text
-        if is_social(r.url) and not is_social(url):  # sosyal yönlendirme cezası
+        son_url, html_text = _sayfa_getir(url, timeout)
+        if is_social(son_url) and not is_social(url):  # sosyal yönlendirme cezası
             html_text = "<!--REDIRECT_TO_SOCIAL-->" + html_text
         CACHE.set_html(url, html_text)
         return html_text
-    except Exception:
+    except Exception as e:
+        anahtar, neden, host_duzeyi = _hata_siniflandir(url, e)
+        if host_duzeyi or isinstance(e, _IcerikReddi):
+            # DNS/bağlantı hatasında ya da içerik türü reddinde UA değiştirip tekrar denemek anlamsız (Retry zaten denedi)
+            if anahtar: CACHE.set_neg(anahtar, neden)
+            return None
         # kısa backoff ile ikinci bir deneme (farklı UA)
         try:
-            r = SESSION.get(url, headers=headers(), timeout=max(3, timeout-2), allow_redirects=True)
-            r.raise_for_status()
-            html_text = r.text
+            _son, html_text = _sayfa_getir(url, max(3, timeout-2))
             CACHE.set_html(url, html_text)
             return html_text
-        except Exception:
+        except Exception as e2:
+            anahtar, neden, _ = _hata_siniflandir(url, e2)
+            if anahtar: CACHE.set_neg(anahtar, neden)
             return None
 
 # ===== Arama backendleri =====
 def _serpapi_key() -> Optional[str]:
     return os.environ.get('SERPAPI_KEY') or os.environ.get('SERPAPI_API_KEY')
 
+@OLCUM.olculen('arama.serpapi')
+@KASET.sar('arama.serpapi', 2, lambda args: [])
 def search_serpapi(query: str, n: int) -> List[str]:
     key = _serpapi_key()
     if not key:
@@ -370,6 +1330,8 @@ def search_serpapi(query: str, n: int) -> List[str]:
     except Exception:
         return []
 
+@OLCUM.olculen('arama.google')
+@KASET.sar('arama.google', 2, lambda args: [])
 def search_google(query:str, n:int) -> List[str]:
     # Önce SerpAPI, yoksa googlesearch, o da olmazsa boş
     res = search_serpapi(query, n)
@@ -381,6 +1343,8 @@ def search_google(query:str, n:int) -> List[str]:
     except Exception:
         return []
 
+@OLCUM.olculen('arama.duckduckgo')
+@KASET.sar('arama.duckduckgo', 2, lambda args: [])
 def search_duckduckgo_html(query:str, n:int) -> List[str]:
     # HTML arayüz + lite fallback
     links = []
@@ -412,8 +1376,11 @@ def search_duckduckgo_html(query:str, n:int) -> List[str]:
     return links[:n]
 
 def run_search(query:str) -> List[str]:
-    cached = CACHE.get_results(query)
-    if cached is not None: return cached
+    # kaset modunda sorgu cache'i atlanır: her arama kasete girsin / kasetten gelsin
+    cached = CACHE.get_results(query) if not KASET.mod else None
+    if cached is not None:
+        OLCUM.say('arama.cache_hit')
+        return cached
     # Google ve DDG paralel çalışsın
     results = []
     with ThreadPoolExecutor(max_workers=2) as ex:
@@ -425,6 +1392,9 @@ def run_search(query:str) -> List[str]:
                 results.extend(part)
             except Exception:
                 pass
+    return _arama_sonuclarini_kaydet(query, results)
+
+def _arama_sonuclarini_kaydet(query:str, results:List[str]) -> List[str]:
     # uniq + cache
     clean, seen = [], set()
     for u in results:
@@ -432,12 +1402,13 @@ def run_search(query:str) -> List[str]:
         u = u.strip()
         if u not in seen:
             seen.add(u); clean.append(u)
-    CACHE.set_results(query, clean)
+    if not KASET.mod:  # kaset modunda paylaşılan cache'e yazma: eksik kasetin boş sonuçları canlı koşuyu zehirlemesin
+        CACHE.set_results(query, clean)
     return clean
 
 # ===== Aday domain üretimi =====
 def candidate_domains(firma_adi:str) -> List[str]:
-    firma_norm = metni_normallestir(firma_adi)
+    firma_norm = kisa_metni_normallestir(firma_adi)
     core_tokens = marka_cekirdegi_tokenleri(firma_norm)
     if not core_tokens:
         toks = [t for t in firma_norm.split() if t not in SIRKET_EKLERI]
@@ -454,9 +1425,141 @@ def candidate_domains(firma_adi:str) -> List[str]:
             cands.append(f"http://{s}{e}")
     return cands
 
+# ===== Tahmin edilen alan adlarını DNS ile ön eleme =====
+def _alan_durumu(alan:str) -> bool:
+    """Alan çözülüyor mu ya da sonuç bilinmiyor mu (NXDOMAIN değilse True). Sonuç dns cache'inde kalır."""
+    return bool(dns_kaydi(alan)) or alan in _DNS_BELIRSIZ
+
+def _on_eleme_uygula(urls:List[str], durum:Dict[str, bool]) -> List[str]:
+    return [u for u in urls if durum.get(alan_adini_ayikla(u), True)]  # NXDOMAIN olanlar atılır
+
+def aday_alanlarini_ele(urls:List[str]) -> List[str]:
+    """candidate_domains tahminlerini HTTP'den önce eler: NXDOMAIN olanlar atılır. Çözümleme paralel ve cache'li.
+    http/https ikizi burada değil, top-k kesiminden sonra ikizleri_sec ile seçilir (TLS sadece kalan adaylara)."""
+    hostlar = sorted({alan_adini_ayikla(u) for u in urls})
+    if not hostlar: return []
+    with ThreadPoolExecutor(max_workers=min(16, len(hostlar))) as ex:
+        durum = dict(zip(hostlar, ex.map(_alan_durumu, hostlar)))
+    return _on_eleme_uygula(urls, durum)
+
+def _ikiz_uygula(adaylar:List[Dict], auto_set, https_ok:Dict[str, bool], firma_tokens:List[str]) -> List[Dict]:
+    sonuc = []
+    for a in adaylar:
+        url = a['url']
+        ok = https_ok.get(alan_adini_ayikla(url)) if a.get('tahmin') else None
+        if ok is not None:
+            hedef = ('https://' if ok else 'http://') + url.split('://', 1)[-1]
+            if hedef != url and hedef in auto_set:
+                a = {**a, 'url': hedef, 'puan': quick_url_score(hedef, "", firma_tokens)}
+        sonuc.append(a)
+    return sonuc
+
+def _ikiz_hostlari(adaylar:List[Dict], auto_set) -> List[str]:
+    return sorted({alan_adini_ayikla(a['url']) for a in adaylar if a.get('tahmin') and a['url'] in auto_set})
+
+def ikizleri_sec(adaylar:List[Dict], auto_set, firma_tokens:List[str]) -> List[Dict]:
+    """top-k'ya kalan tahmin adaylarında http/https ikizinden cevap vereni seçer.
+
+    TLS el sıkışması sadece bu hostlar için yapılır; sonuç cert cache'inde kalır ve ssl_cn_matches tekrar bağlanmaz.
+    """
+    hostlar = _ikiz_hostlari(adaylar, auto_set)
+    if not hostlar: return adaylar
+    with ThreadPoolExecutor(max_workers=min(8, len(hostlar))) as ex:
+        https_ok = dict(zip(hostlar, ex.map(lambda h: sertifika_adlari(h) is not None, hostlar)))
+    return _ikiz_uygula(adaylar, auto_set, https_ok, firma_tokens)
+
+# ===== Aday tekilleştirme =====
+_IZLEME_PARAMLARI = {"gclid", "fbclid", "yclid", "msclkid", "dclid", "mc_cid", "mc_eid", "_ga", "_gl", "ref", "srsltid", "trk"}
+
+def url_kanonik(url:str) -> str:
+    """Karşılaştırma anahtarı: küçük harf şema/host, www. ve varsayılan port yok,
+    izleme parametreleri ve fragment atılmış, sondaki / kırpılmış."""
+    try:
+        p = urlparse(url.strip())
+        host = (p.hostname or '').rstrip('.')
+        port = p.port
+    except Exception:
+        return url
+    if host.startswith('www.'): host = host[4:]
+    netloc = host if port in (None, 80, 443) else f"{host}:{port}"
+    sorgu = _izlemesiz_sorgu(p.query)
+    return f"{(p.scheme or 'http').lower()}://{netloc}{p.path.rstrip('/')}" + (f"?{sorgu}" if sorgu else "")
+
+def _izlemesiz_sorgu(sorgu:str) -> str:
+    return '&'.join(q for q in sorgu.split('&')
+                    if q and not (q.split('=')[0].lower().startswith('utm_') or q.split('=')[0].lower() in _IZLEME_PARAMLARI))
+
+def izleme_temizle(url:str) -> str:
+    """URL'den utm_* / izleme parametrelerini ve fragment'i atar; geri kalanı (şema, host, yol) olduğu gibi bırakır."""
+    try:
+        p = urlparse(url.strip())
+        return urlunparse(p._replace(query=_izlemesiz_sorgu(p.query), fragment=''))
+    except Exception:
+        return url
+
+def _aday_grubu(url:str) -> str:
+    # sosyal profiller URL'nin kendisiyle (şema hariç), siteler kayıtlı alan adıyla gruplanır
+    if is_social(url):
+        return url_kanonik(url).split('://', 1)[-1]
+    second, suffix = _registrable_domain_parts(alan_adini_ayikla(url))
+    return f"{second}.{suffix}" if suffix else second
+
+_YEDEK_SAYISI = 3
+
+def adaylari_tekillestir(urls, tahminler, firma_tokens:List[str]) -> List[Dict]:
+    """Aynı siteye ait adayları (http/https, www., derin link, izleme parametresi) tek adaya indirir.
+
+    tahminler: sadece candidate_domains'ten gelen (aramada çıkmamış) URL'ler.
+    Temsilci (izleme parametreleri atılmış hali): en yüksek URL puanı, sonra arama sonucundan gelen, https,
+    en kısa yol (kök sayfa). Grubun bir üyesi bile aramadan geldiyse aday tahmin sayılmaz (tahmin kuralları uygulanmaz).
+    Temsilcinin sayfası gelmezse denenmek üzere gruptaki sonraki üyeler 'yedekler'de (en fazla _YEDEK_SAYISI).
+    dönüş: [{'url': temsilci, 'puan': quick_url_score, 'tahmin': bool, 'yedekler': [{'url','puan'}]}]
+    (her site bir kez puanlanır/fetch edilir)
+    """
+    gruplar: Dict[str, Dict[str, Tuple]] = {}
+    for url in urls:
+        temiz = izleme_temizle(url)
+        tahmin = url in tahminler
+        kanonik = url_kanonik(temiz)
+        anahtar = (-quick_url_score(temiz, "", firma_tokens), tahmin, not temiz.lower().startswith('https://'),
+                   len(kanonik.split('://', 1)[-1]), temiz)
+        uyeler = gruplar.setdefault(_aday_grubu(url), {})  # kanonik -> en iyi yazım (sondaki / vb. tek üye)
+        if kanonik not in uyeler or anahtar < uyeler[kanonik]:
+            uyeler[kanonik] = anahtar
+    sonuc = []
+    for uyeler in gruplar.values():
+        sirali = sorted(uyeler.values())
+        sonuc.append({'url': sirali[0][-1], 'puan': -sirali[0][0], 'tahmin': all(a[1] for a in sirali),
+                      'yedekler': [{'url': a[-1], 'puan': -a[0]} for a in sirali[1:1+_YEDEK_SAYISI]]})
+    return sonuc
+
+def cevap_veren_aday(a:Dict) -> Dict:
+    """Temsilcinin sayfası gelmezse gruptaki sıradaki üyeyi dener; fetch cache'li olduğundan değerlendirme tekrar indirmez."""
+    if not a.get('yedekler') or fetch(a['url'], AYARLAR['ISTEK_ZAMAN_ASIMI']):
+        return a
+    for y in a['yedekler']:
+        if fetch(y['url'], AYARLAR['ISTEK_ZAMAN_ASIMI']):
+            return {**a, **y, 'yedekler': []}
+    return a
+
 # ===== İçerik çıkarım =====
+_PARSER = None
+
+def _html_parser() -> str:
+    global _PARSER
+    if _PARSER is None:
+        secim = AYARLAR.get('HTML_PARSER') or 'html.parser'
+        if secim != 'html.parser':
+            try:
+                BeautifulSoup("<p></p>", secim)
+            except Exception:
+                secim = 'html.parser'  # lxml vb. kurulu değil
+        _PARSER = secim
+    return _PARSER
+
+@OLCUM.olculen('ayristirma')
 def extract_text_signals(html_text:str) -> Dict[str,str]:
-    soup = BeautifulSoup(html_text, "html.parser")
+    soup = BeautifulSoup(html_text, _html_parser())
     title = (soup.title.string if soup.title else "") or ""
     title = html.unescape(title)
     metas = " ".join([m.get("content","") for m in soup.find_all("meta") if m.get("content")])
@@ -476,36 +1579,197 @@ def extract_text_signals(html_text:str) -> Dict[str,str]:
         "full": metni_normallestir(full),
     }
 
+class _LRU:
+    def __init__(self, kapasite:int):
+        self.kapasite = kapasite
+        self._d: OrderedDict = OrderedDict()
+        self._kilit = threading.Lock()
+    def get(self, anahtar):
+        with self._kilit:
+            if anahtar not in self._d: return None
+            self._d.move_to_end(anahtar)
+            return self._d[anahtar]
+    def set(self, anahtar, deger):
+        with self._kilit:
+            self._d[anahtar] = deger
+            self._d.move_to_end(anahtar)
+            while len(self._d) > self.kapasite:
+                self._d.popitem(last=False)
+
+# Aynı HTML (aynı URL'nin tekrar okunması, http/https ikizleri, deep_verify kökü) bir kez parse edilir
+_SIG_LRU = _LRU(AYARLAR['SIG_BELLEK_KAYIT'])
+_PARK_LRU = _LRU(AYARLAR['SIG_BELLEK_KAYIT'])
+
+def _icerik_hash(html_text:str) -> str:
+    return hashlib.sha1(html_text.encode('utf-8', 'replace')).hexdigest()
+
+def sayfa_sinyalleri(html_text:str) -> Dict[str,str]:
+    """extract_text_signals'ın içerik hash'ine göre cache'li hali (bellek + opsiyonel SQLite)."""
+    h = _icerik_hash(html_text)
+    sig = _SIG_LRU.get(h)
+    if sig is not None:
+        return sig
+    kalici = AYARLAR.get('SIG_KALICI')
+    if kalici:
+        cached = CACHE.get_kv('sig_cache', h)
+        if cached is not None:
+            sig = json.loads(cached)
+    if sig is None:
+        sig = extract_text_signals(html_text)
+        if kalici:
+            CACHE.set_kv('sig_cache', h, json.dumps(sig, ensure_ascii=False))
+    _SIG_LRU.set(h, sig)
+    return sig
+
+def ham_sayfa_park_mi(html_text:str) -> bool:
+    """Ham HTML'in normalize hali üzerinde park/boş sayfa kontrolü (içerik hash'ine göre cache'li)."""
+    h = _icerik_hash(html_text)
+    sonuc = _PARK_LRU.get(h)
+    if sonuc is None:
+        sonuc = is_parked_page(metni_normallestir(html_text))
+        _PARK_LRU.set(h, sonuc)
+    return sonuc
+
 # ===== Sektör sözlüğü sinyali =====
-def sektor_lexicon_hits(full_text: str, sektorler: List[str]) -> int:
-    text = full_text
+_SOZLUK_TETIKLEYICI = {
+    'ozel_guvenlik': ["güvenlik","guvenlik","özel güvenlik","ozel guvenlik","koruma"],
+    'isg_osgb': ["isg","iş sağlığı","osgb"],
+    'danismanlik_bilisim': ["bilişim","bilisim","danışmanlık","danismanlik","yazılım","yazilim"],
+}
+
+def sektor_lexicon_hits(full_text: str, sektorler: List[str], sayfa_hits: Optional[Dict[str, set]] = None) -> int:
+    # sayfa_hits: SAYFA_ESLESTIRICI.bul(full_text) önceden hesaplandıysa tekrar taranmaz
     hits = 0
-    if any(s in sektorler for s in ["güvenlik","guvenlik","özel güvenlik","ozel guvenlik","koruma"]):
-        if any(k in text for k in AYARLAR['SEKTOR_SOZLUK']['ozel_guvenlik']): hits += 1
-    if any(s in sektorler for s in ["isg","iş sağlığı","osgb"]):
-        if any(k in text for k in AYARLAR['SEKTOR_SOZLUK']['isg_osgb']): hits += 1
-    if any(s in sektorler for s in ["bilişim","bilisim","danışmanlık","danismanlik","yazılım","yazilim"]):
-        if any(k in text for k in AYARLAR['SEKTOR_SOZLUK']['danismanlik_bilisim']): hits += 1
+    for ad, tetik in _SOZLUK_TETIKLEYICI.items():
+        if any(s in sektorler for s in tetik):
+            if sayfa_hits is None:
+                sayfa_hits = SAYFA_ESLESTIRICI.bul(full_text)
+            if sayfa_hits[f"sozluk:{ad}"]: hits += 1
     return hits
 
+# ===== İçerik sinyal kaydı =====
+_BOS_SIG = {"title":"","metas":"","og":"","h":"","footer":"","full":""}
+
+class SinyalKaydi:
+    """Bir sayfanın (sig + url) firma/sektör/il bağlamındaki içerik bayrakları.
+
+    sig['full'] üzerindeki regex/alt dizi taramaları burada bir kez yapılır; content_score,
+    content_signal_count, extract_features ve review kanıtları hep bu kayıttan türetilir.
+    Doğrudan değil sinyal_kaydi() ile kurulur ki aynı sayfa + firma için tek kayıt paylaşılsın.
+    """
+    __slots__ = ('firma_title', 'firma_meta', 'firma_og', 'firma_h', 'firma_footer', 'firma_full',
+                 'sektor', 'il', 'email_dom', 'yasal_id', 'tel', 'sozluk_hits', 'parked')
+
+    def __init__(self, sig:Dict[str,str], url:str, firma_norm:str, sektorler:List[str], il:str):
+        full = sig.get('full', '')
+        f = bool(firma_norm)
+        self.firma_title  = f and firma_norm in sig.get('title', '')
+        self.firma_meta   = f and firma_norm in sig.get('metas', '')
+        self.firma_og     = f and firma_norm in sig.get('og', '')
+        self.firma_h      = f and firma_norm in sig.get('h', '')
+        self.firma_footer = f and firma_norm in sig.get('footer', '')
+        self.firma_full   = f and firma_norm in full
+        sayfa = SAYFA_ESLESTIRICI.bul(full)
+        self.sektor = bool(sektorler) and bool(_sektor_eslestirici(tuple(sektorler)).bul(full)['sektor'])
+        self.il = bool(il) and (il in sayfa['il'] if il in _IL_KUMESI else il in full)
+        alan = alan_adini_ayikla(url)
+        self.email_dom = False
+        if alan:
+            akok = alan_kok(alan)
+            self.email_dom = any(alan_kok(m) == akok for m in MAIL_DOM_RE.findall(full))
+        self.yasal_id = bool(MERSIS_RE.search(full) or VERGI_RE.search(full) or SICIL_RE.search(full))
+        self.tel = bool(TEL_RE.search(full) or TEL_INTL_RE.search(full))
+        self.sozluk_hits = sektor_lexicon_hits(full, sektorler, sayfa)
+        self.parked = bool(sayfa['parking'])
+
+    @property
+    def firma_metaog(self) -> bool:
+        return self.firma_meta or self.firma_og
+
+    def sinyal_sayisi(self) -> int:
+        return (int(self.firma_title) + int(self.firma_metaog) + int(self.firma_h) + int(self.firma_footer)
+                + int(self.sektor) + int(self.il) + int(self.email_dom) + int(self.yasal_id)
+                + int(self.firma_full) + self.sozluk_hits)
+
+    def kanit_bayraklari(self, il:str) -> List[str]:
+        flags = []
+        if self.firma_title:  flags.append("title")
+        if self.firma_meta:   flags.append("meta")
+        if self.firma_h:      flags.append("h1/h2")
+        if self.il:           flags.append(f"il:{il}")
+        if self.email_dom:    flags.append("email-domain")
+        if self.yasal_id:     flags.append("yasal-id")
+        return flags
+
+# (id(sig), url, firma, sektörler, il) -> (sig, kayıt); sig referansı tutulduğu için id yeniden kullanılamaz
+_KAYIT_LRU = _LRU(AYARLAR['SIG_BELLEK_KAYIT'])
+
+def sinyal_kaydi(sig:Dict[str,str], url:str, firma_norm:str, sektorler:List[str], il:str) -> SinyalKaydi:
+    """Aynı sayfa + firma bağlamı için SinyalKaydi'ni bir kez kurar (skor, özellik, kanıt ve deep_verify ortak kullanır)."""
+    anahtar = (id(sig), url, firma_norm, tuple(sektorler), il)
+    kayit = _KAYIT_LRU.get(anahtar)
+    if kayit is not None and kayit[0] is sig:
+        return kayit[1]
+    k = SinyalKaydi(sig, url, firma_norm, sektorler, il)
+    _KAYIT_LRU.set(anahtar, (sig, k))
+    return k
+
 # ===== İçerik sinyali sayacı =====
 def content_signal_count(sig: Dict[str,str], url: str, firma_norm: str, sektorler: List[str], il: str) -> int:
-    cnt = 0
-    if firma_norm and firma_norm in sig['title']: cnt += 1
-    if firma_norm and (firma_norm in sig['metas'] or firma_norm in sig['og']): cnt += 1
-    if firma_norm and firma_norm in sig['h']: cnt += 1
-    if firma_norm and firma_norm in sig['footer']: cnt += 1
-    if sektorler and any(sek in sig['full'] for sek in sektorler): cnt += 1
-    if il and il in sig['full']: cnt += 1
-    mails = re.findall(r'[a-z0-9\._%+-]+@([a-z0-9\.-]+\.[a-z]{2,})', sig['full'])
-    alan = alan_adini_ayikla(url)
-    if mails and alan and any(alan_kok(m)==alan_kok(alan) for m in mails): cnt += 1
-    ids = extract_legal_ids(sig['full'])
-    if ids['mersis'] or ids['vergi'] or ids['sicil']: cnt += 1
-    if firma_norm and firma_norm in sig['full']: cnt += 1
-    # sektör sözlüğü
-    cnt += sektor_lexicon_hits(sig['full'], sektorler)
-    return cnt
+    return sinyal_kaydi(sig, url, firma_norm, sektorler, il).sinyal_sayisi()
+
+# ===== Benzerlik =====
+class BenzerlikIndeksi:
+    """Bir firmanın hedef dizileri (çekirdek birleşik ad, handle varyantları) için toplu benzerlik.
+
+    Hedef tarafı bir kez indekslenir (SequenceMatcher b2j + karakter sayımı). Her aday için önce
+    uzunluk ve karakter çoklu-kümesi üst sınırı (real_quick_ratio/quick_ratio eşdeğeri) hesaplanır;
+    eşiğe ya da o ana kadarki en iyi değere ulaşamayacak çiftlerde asıl ratio hiç çalıştırılmaz.
+    Dönen oranlar difflib.SequenceMatcher(None, aday, hedef).ratio() ile birebir aynıdır.
+    """
+    def __init__(self, hedefler: List[str]):
+        self.hedefler = [h for h in dict.fromkeys(hedefler) if h]
+        self._sablon: Dict[str, difflib.SequenceMatcher] = {}
+        self._sayim: Dict[str, Counter] = {}
+        for h in self.hedefler:
+            sm = difflib.SequenceMatcher(None)
+            sm.set_seq2(h)
+            self._sablon[h] = sm
+            self._sayim[h] = Counter(h)
+
+    def _ust_sinir(self, aday: str, aday_sayim: Counter, hedef: str) -> float:
+        toplam = len(aday) + len(hedef)
+        ortak = sum(min(n, aday_sayim[ch]) for ch, n in self._sayim[hedef].items())
+        return 2.0 * ortak / toplam
+
+    def oran(self, aday: str, hedef: str) -> float:
+        # şablonun sığ kopyası: b2j paylaşılır, thread'ler birbirinin a dizisini ezmez
+        sm = copy.copy(self._sablon[hedef])
+        sm.set_seq1(aday)
+        return sm.ratio()
+
+    def en_iyi(self, aday: str, esik: float, yeterli: float = 1.0) -> float:
+        """Hedefler içindeki en yüksek oran; `esik` altı 0.0 döner, `yeterli`ye ulaşınca aramayı keser."""
+        if not aday: return 0.0
+        sayim = Counter(aday)
+        best = 0.0
+        for h in self.hedefler:
+            ust = self._ust_sinir(aday, sayim, h)
+            if ust < esik or ust <= best:
+                continue
+            r = self.oran(aday, h)
+            if r > best:
+                best = r
+                if best >= yeterli:
+                    break
+        return best if best >= esik else 0.0
+
+    def toplu(self, adaylar: List[str], esik: float, yeterli: float = 1.0) -> List[float]:
+        return [self.en_iyi(a, esik, yeterli) for a in adaylar]
+
+@functools.lru_cache(maxsize=4096)
+def benzerlik_indeksi(hedefler: Tuple[str, ...]) -> BenzerlikIndeksi:
+    return BenzerlikIndeksi(list(hedefler))
 
 # ===== Skorlama =====
 def domain_benzenir_mi(domain_kok:str, core_tokens:List[str]) -> bool:
@@ -514,8 +1778,7 @@ def domain_benzenir_mi(domain_kok:str, core_tokens:List[str]) -> bool:
         return False
     if domain_kok.startswith(core_join) or core_join in domain_kok:
         return True
-    ratio = difflib.SequenceMatcher(None, domain_kok, core_join).ratio()
-    return ratio >= 0.82
+    return benzerlik_indeksi((core_join,)).en_iyi(domain_kok, 0.82) >= 0.82
 
 def quick_url_score(url:str, _firma_kok_eskisi:str, firma_tokens:List[str]) -> float:
     p = AYARLAR['PUANLAR']
@@ -540,7 +1803,7 @@ def quick_url_score(url:str, _firma_kok_eskisi:str, firma_tokens:List[str]) -> f
         s += p['TEMIZ_ALAN_ADI_BONUSU']
 
     # negatif kelimeler
-    if any(neg in alan for neg in AYARLAR['NEGATIF_KELIMELER']):
+    if negatif_kelime_var(alan):
         s += p['NEGATIF_ANAHTAR_KELIME']
 
     # çekirdek marka benzerliği
@@ -554,82 +1817,144 @@ def quick_url_score(url:str, _firma_kok_eskisi:str, firma_tokens:List[str]) -> f
             s += 0.8
     return s
 
+def _icerik_azami_kazanci() -> float:
+    """content_score'un ekleyebileceği en yüksek puan (tüm pozitif içerik bonuslarının toplamı)."""
+    p = AYARLAR['PUANLAR']
+    return sum(max(0.0, p[k]) for k in ('ICERIKTE_FIRMA_ADI_GECTI', 'TITLE_ESES', 'META_ESES', 'H1H2_ESES', 'FOOTER_ESES',
+                                         'SEKTOR_ESLESTI', 'IL_ESLESTI', 'MAIL_DOM_ESLESIR', 'TEL_VAR', 'YASAL_ID_BONUS',
+                                         'DNS_VAR_BONUS', 'SSL_CN_BONUS'))
+
 def content_score(url:str, firma_norm:str, sektorler:List[str], il:str, core_tokens:List[str]) -> Tuple[float,int,Dict[str,str]]:
     """dönüş: (puan_artisi, sinyal_say, sig_dict)"""
-    p = AYARLAR['PUANLAR']
     html_text = fetch(url, AYARLAR['ISTEK_ZAMAN_ASIMI'])
     if not html_text: return 0.0, 0, {}
+    sig = sayfa_sinyalleri(html_text)
+    alan = alan_adini_ayikla(url)
+    return _content_score_hesapla(url, html_text, sig, firma_norm, sektorler, il,
+                                  has_dns_a_record(alan), ssl_cn_matches(alan, core_tokens))
+
+def _content_score_hesapla(url:str, html_text:str, sig:Dict[str,str], firma_norm:str, sektorler:List[str], il:str,
+                           dns_ok:bool, ssl_ok:bool) -> Tuple[float,int,Dict[str,str]]:
+    # content_score'un ağ gerektirmeyen kısmı (thread ve async motor ortak kullanır)
+    p = AYARLAR['PUANLAR']
     s = 0.0
     if html_text.startswith("<!--REDIRECT_TO_SOCIAL-->"): s += p['REDIRECT_SM_CEZASI']
-    sig = extract_text_signals(html_text)
+
+    k = sinyal_kaydi(sig, url, firma_norm, sektorler, il)
 
     # Firma adı sinyalleri
-    if firma_norm and firma_norm in sig['full']: s += p['ICERIKTE_FIRMA_ADI_GECTI']
-    if firma_norm and (firma_norm in sig['title']): s += p['TITLE_ESES']
-    if firma_norm and (firma_norm in sig['metas'] or firma_norm in sig['og']): s += p['META_ESES']
-    if firma_norm and (firma_norm in sig['h']): s += p['H1H2_ESES']
-    if firma_norm and (firma_norm in sig['footer']): s += p['FOOTER_ESES']
+    if k.firma_full: s += p['ICERIKTE_FIRMA_ADI_GECTI']
+    if k.firma_title: s += p['TITLE_ESES']
+    if k.firma_metaog: s += p['META_ESES']
+    if k.firma_h: s += p['H1H2_ESES']
+    if k.firma_footer: s += p['FOOTER_ESES']
 
     # Sektör
     if sektorler:
-        if any(sek in sig['full'] for sek in sektorler): s += p['SEKTOR_ESLESTI']
+        if k.sektor: s += p['SEKTOR_ESLESTI']
         else: s += p['SEKTOR_ESLESMEDI']
 
     # Şehir
-    if il and il in sig['full']: s += p['IL_ESLESTI']
-    _ = extract_city_from_text(sig['full'], TR_ILLER)
+    if k.il: s += p['IL_ESLESTI']
 
     # Email domaini
-    mails = re.findall(r'[a-z0-9\._%+-]+@([a-z0-9\.-]+\.[a-z]{2,})', sig['full'])
-    alan = alan_adini_ayikla(url)
-    if mails and alan:
-        for md in mails:
-            if alan_kok(md) == alan_kok(alan):
-                s += p['MAIL_DOM_ESLESIR']; break
+    if k.email_dom: s += p['MAIL_DOM_ESLESIR']
 
     # Telefon
-    if re.search(r'\b0\s?\d{3}\s?\d{3}\s?\d{2}\s?\d{2}\b', sig['full']) or re.search(r'\+\d{2}\s?\d{3}\s?\d{3}\s?\d{2}\s?\d{2}', sig['full']):
-        s += p['TEL_VAR']
+    if k.tel: s += p['TEL_VAR']
 
     # Yasal ID
-    ids = extract_legal_ids(sig['full'])
-    if ids['mersis'] or ids['vergi'] or ids['sicil']:
-        s += p['YASAL_ID_BONUS']
+    if k.yasal_id: s += p['YASAL_ID_BONUS']
 
     # DNS/SSL
-    if has_dns_a_record(alan):
+    if dns_ok:
         s += p['DNS_VAR_BONUS']
-    if ssl_cn_matches(alan, core_tokens):
+    if ssl_ok:
         s += p['SSL_CN_BONUS']
 
-    # Sinyal sayımı (+ sektör sözlüğü)
-    sinyal = content_signal_count(sig, url, firma_norm, sektorler, il)
-
-    # parked/boş sayfa
-    if is_parked_page(sig['full']):
-        sinyal = 0
+    # Sinyal sayımı (+ sektör sözlüğü); parked/boş sayfa -> 0
+    sinyal = 0 if k.parked else k.sinyal_sayisi()
 
     return s, sinyal, sig
 
 # ===== Deep Verify =====
-def deep_verify(base_url: str, firma_norm:str, sektorler:List[str], il:str, core_tokens:List[str]) -> Tuple[int,int]:
-    """Birkaç path'i gezip sinyal toplar. return: (toplam_sinyal, sayfa_sayisi)"""
+_DEEP_ANAHTARLAR = ("iletisim", "hakkimizda", "hakkinda", "about", "contact", "kurumsal", "bize ulasin")
+_ANCHOR_RE = re.compile(r'<a\s[^>]*?href\s*=\s*["\']?([^"\'\s>]+)[^>]*>(.*?)</a>', re.I | re.S)
+_ETIKET_RE = re.compile(r'<[^>]+>')
+_SITEMAP_LOC_RE = re.compile(r'<loc>\s*([^<\s]+)\s*</loc>', re.I)
+
+def _deep_urls(base_url: str) -> List[str]:
+    return [base_url if path == "" else base_url.rstrip('/') + '/' + path for path in AYARLAR['DEEP_PATHS']]
+
+def _deep_adaylari(base_url:str, baglantilar) -> List[str]:
+    """(href, metin) çiftlerinden aynı siteye ait iletişim/hakkımızda sayfalarını seçer."""
+    alan = alan_adini_ayikla(base_url)
+    kok = base_url.rstrip('/') + '/'
+    secilen = []
+    for href, metin in baglantilar:
+        if len(secilen) >= AYARLAR['DEEP_MAX_SAYFA']: break
+        href = html.unescape(href)
+        if href.startswith(('mailto:', 'tel:', 'javascript:')): continue
+        url = urljoin(kok, href).split('#')[0]
+        if url.rstrip('/') == base_url.rstrip('/') or url in secilen: continue
+        if alan_adini_ayikla(url) != alan: continue
+        if any(k in metni_normallestir(href + " " + metin) for k in _DEEP_ANAHTARLAR):
+            secilen.append(url)
+    return secilen
+
+def _kok_baglantilari(base_url:str, html_text:str) -> List[str]:
+    return _deep_adaylari(base_url, ((h, html.unescape(_ETIKET_RE.sub(' ', m))) for h, m in _ANCHOR_RE.findall(html_text)))
+
+def _sitemap_url(base_url:str) -> str:
+    return base_url.rstrip('/') + '/sitemap.xml'
+
+def _sitemap_baglantilari(base_url:str, xml_text:str) -> List[str]:
+    return _deep_adaylari(base_url, ((loc, "") for loc in _SITEMAP_LOC_RE.findall(xml_text)))
+
+def _tahmini_deep_urls(base_url:str) -> List[str]:
+    return [u for u in _deep_urls(base_url) if u != base_url] if AYARLAR['DEEP_TAHMIN_YEDEK'] else []
+
+@OLCUM.olculen('deep_verify')
+def deep_verify(base_url: str, firma_norm:str, sektorler:List[str], il:str, core_tokens:List[str], hedef:Optional[int]=None) -> Tuple[int,int]:
+    """Kök sayfa + sitede bağlantısı olan iletişim/hakkımızda sayfalarından sinyal toplar. return: (toplam_sinyal, sayfa_sayisi)
+
+    Sayfalar paralel çekilir; toplam `hedef`e (varsayılan MIN_SINYAL_AUTO_DOMAIN) ulaşınca kalanlar iptal edilir.
+    Bağlantı kökte yoksa sitemap.xml'e, o da yoksa DEEP_PATHS tahminlerine bakılır.
+    """
+    hedef = AYARLAR['MIN_SINYAL_AUTO_DOMAIN'] if hedef is None else hedef
+    def _tek(url, html_text=None):
+        html_text = html_text or fetch(url, AYARLAR['ISTEK_ZAMAN_ASIMI'])
+        if not html_text: return None
+        return content_signal_count(sayfa_sinyalleri(html_text), url, firma_norm, sektorler, il)
     total = 0
     pages = 0
-    for path in AYARLAR['DEEP_PATHS']:
+    kok = fetch(base_url, AYARLAR['ISTEK_ZAMAN_ASIMI'])
+    if kok:
         try:
-            if path == "":
-                url = base_url
-            else:
-                url = base_url.rstrip('/') + '/' + path
-            html_text = fetch(url, AYARLAR['ISTEK_ZAMAN_ASIMI'])
-            if not html_text: continue
-            sig = extract_text_signals(html_text)
-            s_cnt = content_signal_count(sig, url, firma_norm, sektorler, il)
+            total += _tek(base_url, kok); pages += 1
+        except Exception:
+            pass
+        if total >= hedef:
+            return total, pages
+    urls = _kok_baglantilari(base_url, kok) if kok else []
+    if not urls:
+        sm = fetch(_sitemap_url(base_url), AYARLAR['ISTEK_ZAMAN_ASIMI'])
+        urls = (_sitemap_baglantilari(base_url, sm) if sm else []) or _tahmini_deep_urls(base_url)
+    if not urls:
+        return total, pages
+    ex = ThreadPoolExecutor(max_workers=len(urls))
+    try:
+        for fut in as_completed([ex.submit(_tek, u) for u in urls]):
+            try:
+                s_cnt = fut.result()
+            except Exception:
+                continue
+            if s_cnt is None: continue
             total += s_cnt
             pages += 1
-        except Exception:
-            continue
+            if total >= hedef: break
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
     return total, pages
 
 # ===== Sosyal medya gelişmiş =====
@@ -675,8 +2000,12 @@ def _candidate_handle(u: str):
         return parts[0] if parts else ''
     return ''
 
-def _name_similarity(a: str, b: str) -> float:
-    return difflib.SequenceMatcher(None, a, b).ratio()
+def _handle_benzerligi(handle: str, variants: List[str]) -> float:
+    # 0.66 altı puansız, 0.88 ve üstü en yüksek kademe: bu sınırlar dışında kesin değer gerekmez
+    lower = [v.lower() for v in variants if v]
+    if handle and any(v in handle or handle in v for v in lower):
+        return 1.0
+    return benzerlik_indeksi(tuple(lower)).en_iyi(handle, 0.66, yeterli=0.88)
 
 def _core_variants(core_tokens: list[str]) -> list[str]:
     v = set()
@@ -704,6 +2033,9 @@ def en_iyi_sosyal_medya_linkini_bul(firma_adi:str, firma_tokens:List[str]) -> st
                     if is_social(u): aday.add(u)
             except Exception:
                 continue
+    return _sosyal_adaylari_sec(aday, firma_tokens)
+
+def _sosyal_adaylari_sec(aday:set, firma_tokens:List[str]) -> str:
     if not aday:
         return "Sosyal Medya Hesabı Yok"
 
@@ -718,14 +2050,7 @@ def en_iyi_sosyal_medya_linkini_bul(firma_adi:str, firma_tokens:List[str]) -> st
         for platform, pval in AYARLAR['SOSYAL_MEDYA_PLATFORM_PUANLARI'].items():
             if platform in u:
                 puan += pval; break
-        best_sim = 0.0
-        for v in variants:
-            if not v: continue
-            v = v.lower()
-            if handle and (v in handle or handle in v):
-                best_sim = max(best_sim, 1.0)
-            else:
-                best_sim = max(best_sim, _name_similarity(handle, v))
+        best_sim = _handle_benzerligi(handle, variants)
         if best_sim >= 0.88:
             puan += AYARLAR['SOSYAL_MEDYA_PUANLARI']['KULLANICI_ADI_ESLESMESI']
         elif best_sim >= 0.76:
@@ -749,34 +2074,30 @@ FEATURE_ORDER = [
     "cnt_title","cnt_metaog","cnt_h","cnt_footer","cnt_fullname","cnt_sector","cnt_city","cnt_emaildom","cnt_legal","cnt_tel",
     "dns","ssl"
 ]
+# FEATURE_ORDER ya da extract_features değişirse artırılır; feature_store eski sürümleri yok sayar
+FEATURE_VERSION = 1
 
 def extract_features(url:str, sig:Dict[str,str], url_score:float, firma_norm:str, sektorler:List[str], il:str, core_tokens:List[str]) -> List[float]:
     alan = alan_adini_ayikla(url)
     ext_comtr = 1.0 if alan.endswith(".com.tr") else 0.0
     ext_com   = 1.0 if alan.endswith(".com") else 0.0
     url_clean = 1.0 if ('-' not in alan and (len(alan.split('.'))<=2 or alan.endswith('.com.tr'))) else 0.0
-    url_neg   = 1.0 if any(neg in alan for neg in AYARLAR['NEGATIF_KELIMELER']) else 0.0
+    url_neg   = 1.0 if negatif_kelime_var(alan) else 0.0
 
     akok = alan_kok(alan)
-    core_join = "".join(core_tokens)
-    core_match = 1.0 if core_join and (akok.startswith(core_join) or core_join in akok or difflib.SequenceMatcher(None, akok, core_join).ratio()>=0.82) else 0.0
-
-    def present(s, frag): return 1.0 if (frag and frag in s) else 0.0
-    cnt_title   = present(sig.get('title',''), firma_norm)
-    cnt_metaog  = 1.0 if (firma_norm and (firma_norm in sig.get('metas','') or firma_norm in sig.get('og',''))) else 0.0
-    cnt_h       = present(sig.get('h',''), firma_norm)
-    cnt_footer  = present(sig.get('footer',''), firma_norm)
-    cnt_fullname= present(sig.get('full',''), firma_norm)
-    cnt_sector  = 1.0 if (sektorler and any(sek in sig.get('full','') for sek in sektorler)) else 0.0
-    cnt_city    = present(sig.get('full',''), il)
-
-    mails = re.findall(r'[a-z0-9\._%+-]+@([a-z0-9\.-]+\.[a-z]{2,})', sig.get('full',''))
-    cnt_emaildom= 1.0 if (mails and any(alan_kok(m)==alan_kok(alan) for m in mails)) else 0.0
-
-    ids = extract_legal_ids(sig.get('full',''))
-    cnt_legal  = 1.0 if (ids['mersis'] or ids['vergi'] or ids['sicil']) else 0.0
-
-    cnt_tel    = 1.0 if (re.search(r'\b0\s?\d{3}\s?\d{3}\s?\d{2}\s?\d{2}\b', sig.get('full','')) or re.search(r'\+\d{2}\s?\d{3}\s?\d{3}\s?\d{2}\s?\d{2}', sig.get('full',''))) else 0.0
+    core_match = 1.0 if domain_benzenir_mi(akok, core_tokens) else 0.0
+
+    k = sinyal_kaydi(sig, url, firma_norm, sektorler, il)
+    cnt_title   = float(k.firma_title)
+    cnt_metaog  = float(k.firma_metaog)
+    cnt_h       = float(k.firma_h)
+    cnt_footer  = float(k.firma_footer)
+    cnt_fullname= float(k.firma_full)
+    cnt_sector  = float(k.sektor)
+    cnt_city    = float(k.il)
+    cnt_emaildom= float(k.email_dom)
+    cnt_legal   = float(k.yasal_id)
+    cnt_tel     = float(k.tel)
 
     dns = 1.0 if has_dns_a_record(alan) else 0.0
     sslok = 1.0 if ssl_cn_matches(alan, core_tokens) else 0.0
@@ -786,11 +2107,7 @@ def extract_features(url:str, sig:Dict[str,str], url_score:float, firma_norm:str
              dns, sslok]
     return feats
 
-def sigmoid(x):  # fallback için
-    import math
-    return 1.0/(1.0+math.exp(-x))
-
-def load_calibration():
+def _kalibrasyonu_oku():
     try:
         with open(AYARLAR['CALIB_MODEL'],'rb') as f:
             return ('sk', pickle.load(f))
@@ -802,32 +2119,111 @@ def load_calibration():
         except Exception:
             return (None, None)
 
-def predict_proba_from_feats(feats:List[float], calib_tuple):
+class KalibrasyonYukleyici:
+    """Kalibrasyon modelini tüm işçilere paylaştırır; dosya değişince yeniden yükler.
+
+    Dosya imzası (mtime, boyut) en fazla `aralik` saniyede bir kontrol edilir. Yeni model tek
+    atamayla devreye girer; o an işlenen firma eski modelle tamamlanır.
+    """
+    def __init__(self, aralik:float=5.0):
+        self.aralik = aralik
+        self._kilit = threading.Lock()
+        self._tuple = None
+        self._imza = None
+        self._son_kontrol = 0.0
+
+    @staticmethod
+    def _dosya_imzasi():
+        imza = []
+        for yol in (AYARLAR['CALIB_MODEL'], AYARLAR['CALIB_JSON_FALLBACK']):
+            try:
+                st = os.stat(yol)
+                imza.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                imza.append(None)
+        return tuple(imza)
+
+    def guncel(self, yenile:bool=False):
+        if not yenile and self._tuple is not None and time.monotonic() - self._son_kontrol < self.aralik:
+            return self._tuple
+        with self._kilit:
+            simdi = time.monotonic()
+            if not yenile and self._tuple is not None and simdi - self._son_kontrol < self.aralik:
+                return self._tuple
+            self._son_kontrol = simdi
+            imza = self._dosya_imzasi()
+            if yenile or self._tuple is None or imza != self._imza:
+                self._tuple = _kalibrasyonu_oku()
+                self._imza = imza
+            return self._tuple
+
+KALIBRASYON = KalibrasyonYukleyici(AYARLAR['CALIB_KONTROL_ARALIGI'])
+
+def load_calibration(yenile: bool = False):
+    """Paylaşılan modeli döner (süreç başına bir kez yüklenir, dosya değişirse tazelenir)."""
+    return KALIBRASYON.guncel(yenile)
+
+def _kalib_coz(calib_tuple):
+    # KalibrasyonYukleyici verilmişse firma başında güncel model alınır (sıcak yükleme)
+    return calib_tuple.guncel() if isinstance(calib_tuple, KalibrasyonYukleyici) else calib_tuple
+
+def _json_agirliklari(model: dict, n: int):
+    """JSON ağırlıklarını n boyutlu numpy vektörüne çevirir (model içinde saklanır)."""
+    import numpy as np
+    onbellek = model.get('_np')
+    if onbellek is not None and onbellek[0].shape[0] == n:
+        return onbellek
+    w = np.zeros(n, dtype=float)
+    ham = list(model.get('weights', []))[:n]
+    w[:len(ham)] = ham
+    onbellek = (w, float(model.get('bias', 0.0)))
+    model['_np'] = onbellek
+    return onbellek
+
+@OLCUM.olculen('kalibrasyon')
+def predict_proba_batch(X_list: List[List[float]], calib_tuple) -> List[Optional[float]]:
+    """Özellik vektörlerini tek matriste skorlar; satır başına olasılık (veya None) döner."""
     mode, model = calib_tuple
-    if not mode: return None
+    if not mode or not X_list: return [None]*len(X_list)
+    OLCUM.say('kalibrasyon.satir', len(X_list))
     import numpy as np
-    X = np.array(feats, dtype=float).reshape(1,-1)
+    X = np.asarray(X_list, dtype=float).reshape(len(X_list), -1)
     if mode == 'sk':
         try:
-            return float(model.predict_proba(X)[0,1])
+            return [float(p) for p in model.predict_proba(X)[:,1]]
         except Exception:
-            return None
-    else:
-        w = model.get('weights', [0.0]*len(FEATURE_ORDER))
-        b = model.get('bias', 0.0)
-        z = sum(f*w_i for f, w_i in zip(feats, w)) + b
-        return float(sigmoid(z))
+            return [None]*len(X_list)
+    w, b = _json_agirliklari(model, X.shape[1])
+    with np.errstate(over='ignore'):
+        z = X @ w + b
+        p = 1.0/(1.0+np.exp(-z))
+    return [float(v) for v in p]
+
+def predict_proba_from_feats(feats:List[float], calib_tuple):
+    return predict_proba_batch([feats], calib_tuple)[0]
+
+def _kalibrasyonu_uygula(adaylar: List[dict], calib_tuple, prob_threshold: Optional[float]) -> List[dict]:
+    """Adayların özelliklerini tek çağrıda skorlar, eşik altını eler."""
+    if not calib_tuple[0]:
+        return adaylar
+    skorlu = [a for a in adaylar if '_feats' in a]
+    olasiliklar = predict_proba_batch([a.pop('_feats') for a in skorlu], calib_tuple)
+    elenen = set()
+    for a, p in zip(skorlu, olasiliklar):
+        if p is None: continue
+        a['proba'] = p
+        if prob_threshold is not None and p < prob_threshold:
+            elenen.add(id(a))
+    return [a for a in adaylar if id(a) not in elenen]
 
 # ===== Derin akış =====
 def en_iyi_siteyi_bul(firma_adi:str, il:str, norm_firma:str, firma_tokens:List[str], aranan_sektorler:List[str], deep_verify_on:bool, prob_threshold:Optional[float], calib_tuple) -> str:
-    # 1) Domain tahmini
-    auto_set = set(candidate_domains(firma_adi))
-    aday_adresler = set(auto_set)
-
-    # 2) Arama sonuçları
-    # Aramaları paralel çalıştır
+    # 1) Domain tahmini + 2) Arama sonuçları
+    # Aramaları ve tahminlerin DNS ön elemesini paralel çalıştır
     queries = [sablon.format(firma_adi=firma_adi, il=il) for sablon in AYARLAR['ARAMA_SORGULARI']]
-    with ThreadPoolExecutor(max_workers=len(queries)) as ex:
+    aday_adresler = set()
+    with ThreadPoolExecutor(max_workers=len(queries) + 1) as ex:
+        eleme = ex.submit(aday_alanlarini_ele, candidate_domains(firma_adi))
         futs = [ex.submit(run_search, q) for q in queries]
         for fut in as_completed(futs):
             try:
@@ -835,19 +2231,20 @@ def en_iyi_siteyi_bul(firma_adi:str, il:str, norm_firma:str, firma_tokens:List[s
                     aday_adresler.add(u)
             except Exception:
                 continue
+        auto_set = set(eleme.result())
+    tahminler = auto_set - aday_adresler
+    aday_adresler |= auto_set
     if not aday_adresler:
         return "Arama Sonucu Yok"
 
-    # 3) URL hızlı puan
-    puanlanmis = []
-    for url in aday_adresler:
-        url_skor = quick_url_score(url, "", firma_tokens)
-        puanlanmis.append({'url': url, 'puan': url_skor})
+    # 3) URL hızlı puan (site başına tek aday)
+    puanlanmis = adaylari_tekillestir(aday_adresler, tahminler, firma_tokens)
 
     # 4) İçerik + DeepVerify + Kalibrasyon
     topk = sorted(puanlanmis, key=lambda x: x['puan'], reverse=True)[:AYARLAR['DOGRALANACAK_EN_IYI_ADAY_SAYISI']]
     if not topk:
         return "Arama Sonucu Yok"
+    topk = ikizleri_sec(topk, auto_set, firma_tokens)
 
     GECER_MIN_PUAN = AYARLAR['GECER_MIN_PUAN']
     MIN_SINYAL = AYARLAR['MIN_SINYAL_AUTO_DOMAIN']
@@ -856,35 +2253,30 @@ def en_iyi_siteyi_bul(firma_adi:str, il:str, norm_firma:str, firma_tokens:List[s
 
     # İçerik kontrolünü paralel yap
     def _evaluate(a):
+        a = cevap_veren_aday(a)
         html_text = fetch(a['url'], AYARLAR['ISTEK_ZAMAN_ASIMI'])
         sig = {}
         sinyal_say = 0
         puan = a['puan']
         if html_text:
-            html_norm = metni_normallestir(html_text)
-            if is_parked_page(html_norm):
+            if ham_sayfa_park_mi(html_text):
                 return None
             cs, cscnt, sig = content_score(a['url'], norm_firma, aranan_sektorler, il, core_tokens)
             puan += cs
             sinyal_say = cscnt
         else:
-            if a['url'] in auto_set:
+            if a['tahmin']:
                 return None
-        if deep_verify_on and (a['url'] in auto_set or sinyal_say == 0):
+        if deep_verify_on and (a['tahmin'] or sinyal_say == 0):
             dv_sum, dv_pages = deep_verify(a['url'], norm_firma, aranan_sektorler, il, core_tokens)
             sinyal_say += dv_sum
-        if a['url'] in auto_set and sinyal_say < MIN_SINYAL:
+        if a['tahmin'] and sinyal_say < MIN_SINYAL:
             return None
         if sinyal_say == 0 and puan <= GECER_MIN_PUAN:
             return None
         rec = {'url': a['url'], 'puan': puan}
         if calib_tuple[0]:
-            feats = extract_features(a['url'], sig or {"title":"","metas":"","og":"","h":"","footer":"","full":""}, puan, norm_firma, aranan_sektorler, il, core_tokens)
-            p = predict_proba_from_feats(feats, calib_tuple)
-            if p is not None:
-                rec['proba'] = p
-                if prob_threshold is not None and p < prob_threshold:
-                    return None
+            rec['_feats'] = extract_features(a['url'], sig or _BOS_SIG, puan, norm_firma, aranan_sektorler, il, core_tokens)
         return rec
 
     with ThreadPoolExecutor(max_workers=min(6, len(topk))) as ex:
@@ -896,6 +2288,8 @@ def en_iyi_siteyi_bul(firma_adi:str, il:str, norm_firma:str, firma_tokens:List[s
             except Exception:
                 continue
 
+    # top-k adayların olasılıkları tek matris çağrısıyla
+    aday_gecerler = _kalibrasyonu_uygula(aday_gecerler, calib_tuple, prob_threshold)
     if not aday_gecerler:
         return "Yeterli Skora Sahip Aday Yok"
 
@@ -907,10 +2301,10 @@ def en_iyi_siteyi_bul(firma_adi:str, il:str, norm_firma:str, firma_tokens:List[s
 
 # --- Top-K aday + kanıt (review modu) ---
 def en_iyi_site_adaylari(firma_adi, il, norm_firma, firma_tokens, aranan_sektorler, topk=3, deep_verify_on=True):
-    auto_set = set(candidate_domains(firma_adi))
-    aday_adresler = set(auto_set)
     queries = [sablon.format(firma_adi=firma_adi, il=il) for sablon in AYARLAR['ARAMA_SORGULARI']]
-    with ThreadPoolExecutor(max_workers=len(queries)) as ex:
+    aday_adresler = set()
+    with ThreadPoolExecutor(max_workers=len(queries) + 1) as ex:
+        eleme = ex.submit(aday_alanlarini_ele, candidate_domains(firma_adi))
         futs = [ex.submit(run_search, q) for q in queries]
         for fut in as_completed(futs):
             try:
@@ -918,45 +2312,75 @@ def en_iyi_site_adaylari(firma_adi, il, norm_firma, firma_tokens, aranan_sektorl
                     aday_adresler.add(u)
             except Exception:
                 continue
+        auto_set = set(eleme.result())
+    tahminler = auto_set - aday_adresler
+    aday_adresler |= auto_set
 
-    puanlanmis = []
     core_tokens = marka_cekirdegi_tokenleri(norm_firma)
-    def _review_eval(url):
-        url_skor = quick_url_score(url, "", norm_firma.split())
+    def _review_eval(a):
+        a = cevap_veren_aday(a)
+        url, url_skor, tahmin = a['url'], a['puan'], a['tahmin']
         html_text = fetch(url, AYARLAR['ISTEK_ZAMAN_ASIMI'])
         kanit = {}
         c_skor = 0.0
         sinyal_say = 0
+        sig = _BOS_SIG
         if html_text:
-            sig = extract_text_signals(html_text)
-            flags = []
-            if norm_firma and norm_firma in sig['title']: flags.append("title")
-            if norm_firma and norm_firma in sig['metas']: flags.append("meta")
-            if norm_firma and norm_firma in sig['h']:     flags.append("h1/h2")
-            if il and il in sig['full']:                  flags.append(f"il:{il}")
-            mails = re.findall(r'[a-z0-9\._%+-]+@([a-z0-9\.-]+\.[a-z]{2,})', sig['full'])
+            sig = sayfa_sinyalleri(html_text)
+            flags = sinyal_kaydi(sig, url, norm_firma, aranan_sektorler, il).kanit_bayraklari(il)
             alan = alan_adini_ayikla(url)
-            if mails and alan and any(alan_kok(m)==alan_kok(alan) for m in mails): flags.append("email-domain")
-            ids = extract_legal_ids(sig['full'])
-            if ids['mersis'] or ids['vergi'] or ids['sicil']: flags.append("yasal-id")
-            c_skor, sinyal_say, _ = content_score(url, norm_firma, aranan_sektorler, il, core_tokens)
-            if deep_verify_on and (url in auto_set or sinyal_say == 0):
-                dv_sum, dv_pages = deep_verify(url, norm_firma, aranan_sektorler, il, core_tokens)
-                sinyal_say += dv_sum
-                if dv_sum >= AYARLAR['MIN_SINYAL_AUTO_DOMAIN']: flags.append("deep-verify")
-            kanit = {"flags": ",".join(flags) if flags else "", "title": sig['title'][:120], "sinyal": sinyal_say}
+            c_skor, sinyal_say, _ = _content_score_hesapla(url, html_text, sig, norm_firma, aranan_sektorler, il,
+                                                           has_dns_a_record(alan), ssl_cn_matches(alan, core_tokens))
+            kanit = {"flags": flags, "title": sig['title'][:120], "sinyal": sinyal_say}
         toplam = url_skor + c_skor
-        return {"url": url, "puan": toplam, "kanit": kanit}
-
-    with ThreadPoolExecutor(max_workers=min(8, len(aday_adresler)) ) as ex:
-        futures = [ex.submit(_review_eval, url) for url in aday_adresler]
-        for fut in as_completed(futures):
-            try:
-                puanlanmis.append(fut.result())
-            except Exception:
-                continue
+        return {"url": url, "puan": toplam, "kanit": kanit, "tahmin": tahmin, "_sig": sig}
+
+    # URL puanına göre sırala; içerik puanı en fazla azami_kazanc ekleyebileceğinden, k'ıncı en iyi
+    # değerlendirilmiş aday kalanların üst sınırını geçince top-k kesinleşir ve durulur.
+    sirali = sorted(adaylari_tekillestir(aday_adresler, tahminler, norm_firma.split()), key=lambda x: -x['puan'])
+    azami_kazanc = _icerik_azami_kazanci()
+    butce = AYARLAR['REVIEW_FETCH_BUDGET']
+    if butce is not None: sirali = sirali[:max(butce, topk)]
+    # http/https ikizi sadece bütçeye kalan tahmin adayları için TLS ile seçilir
+    sirali = sorted(ikizleri_sec(sirali, auto_set, norm_firma.split()), key=lambda x: -x['puan'])
+    dalga = max(1, AYARLAR['REVIEW_DALGA'])
+    puanlanmis = []
+    sira = 0
+    with ThreadPoolExecutor(max_workers=max(1, min(dalga, len(sirali)))) as ex:
+        while sira < len(sirali):
+            if len(puanlanmis) >= topk:
+                kesik = sorted((a['puan'] for a in puanlanmis), reverse=True)[topk-1]
+                if kesik >= sirali[sira]['puan'] + azami_kazanc:
+                    break
+            futures = [ex.submit(_review_eval, a) for a in sirali[sira:sira+dalga]]
+            sira += dalga
+            for fut in as_completed(futures):
+                try:
+                    puanlanmis.append(fut.result())
+                except Exception:
+                    continue
 
     top = sorted(puanlanmis, key=lambda x: x['puan'], reverse=True)[:topk]
+    # derin doğrulama sadece kanıtı yazılacak top-k için (puanı etkilemez)
+    def _derin(a):
+        kanit = a['kanit']
+        if not kanit: return
+        flags = kanit['flags']
+        if deep_verify_on and (a['tahmin'] or kanit['sinyal'] == 0):
+            dv_sum, dv_pages = deep_verify(a['url'], norm_firma, aranan_sektorler, il, core_tokens)
+            kanit['sinyal'] += dv_sum
+            if dv_sum >= AYARLAR['MIN_SINYAL_AUTO_DOMAIN']: flags.append("deep-verify")
+        kanit['flags'] = ",".join(flags) if flags else ""
+    if top:
+        with ThreadPoolExecutor(max_workers=len(top)) as ex:
+            list(ex.map(_derin, top))
+    # kalibrasyon yeniden fetch etmesin diye top-k özellikleri feature_store'a
+    def _ozellik_kaydet(a):
+        feats = extract_features(a['url'], a.pop('_sig'), a['puan'], norm_firma, aranan_sektorler, il, core_tokens)
+        CACHE.set_features(norm_firma, a['url'], FEATURE_VERSION, feats)
+    if top:
+        with ThreadPoolExecutor(max_workers=len(top)) as ex:
+            list(ex.map(_ozellik_kaydet, top))
     return top
 
 def guven_skoru(aday):
@@ -966,26 +2390,409 @@ def guven_skoru(aday):
     return int(40 + (p-5)*3)
 
 # ===== Dış arayüz =====
-def firma_icin_en_iyi_linki_bul(firma_adi:str, sektor:str="", adres:str="", deep_verify_on=True, prob_threshold:Optional[float]=None, calib_tuple=(None,None)) -> str:
-    if not firma_adi: return "Firma Adı Boş"
-    norm = metni_normallestir(firma_adi)
+def firma_girdisi(firma_adi:str, sektor:str="", adres:str="") -> Tuple[str, List[str], str, List[str]]:
+    """dönüş: (norm_firma, tokens, il, aranan_sektorler)"""
+    norm = kisa_metni_normallestir(firma_adi)
     tokens = norm.split()
     il = adresten_ili_al(adres)
     # aranan sektör seti
     aranan = set()
     if sektor:
-        for w in metni_normallestir(sektor).split():
+        for w in kisa_metni_normallestir(sektor).split():
             if w: aranan.add(w)
     for w in tokens:
-        if w in AYARLAR['SEKTOR_KELIMELERI']: aranan.add(w)
-    site = en_iyi_siteyi_bul(firma_adi, il, norm, tokens, list(aranan), deep_verify_on, prob_threshold, calib_tuple)
+        if w in _SEKTOR_KELIME_KUMESI: aranan.add(w)
+    return norm, tokens, il, list(aranan)
+
+def girdileri_hazirla(df: "pd.DataFrame") -> "pd.DataFrame":
+    """Firma Adı/Sektör/Adres sütunlarını tüm tablo için bir kerede normalize eder.
+
+    dönüş: df ile aynı index'li (firma, sektor, adres, girdi) tablosu; girdi = firma_girdisi() çıktısı.
+    df'e sütun eklenmez (çıktı dosyası değişmesin).
+    """
+    def _kol(ad):
+        return df[ad] if ad in df.columns else pd.Series([""] * len(df), index=df.index, dtype=object)
+    firma, sektor, adres = _kol("Firma Adı"), _kol("Sektör"), _kol("Adres")
+    norm = normallestir_seri(firma)
+    il = normallestir_seri(adres).str.findall(_IL_TOKEN_RE).str[-1].fillna("")
+    girdiler = []
+    for n, i, sek in zip(norm, il, normallestir_seri(sektor)):
+        tokens = n.split()
+        aranan = set(sek.split())
+        aranan.update(w for w in tokens if w in _SEKTOR_KELIME_KUMESI)
+        girdiler.append((n, tokens, i, list(aranan)))
+    return pd.DataFrame({"firma": firma, "sektor": sektor, "adres": adres, "girdi": girdiler}, index=df.index)
+
+def firma_icin_en_iyi_linki_bul(firma_adi:str, sektor:str="", adres:str="", deep_verify_on=True, prob_threshold:Optional[float]=None, calib_tuple=(None,None), girdi=None) -> str:
+    if not firma_adi: return "Firma Adı Boş"
+    norm, tokens, il, aranan = girdi or firma_girdisi(firma_adi, sektor, adres)
+    calib_tuple = _kalib_coz(calib_tuple)
+    site = en_iyi_siteyi_bul(firma_adi, il, norm, tokens, aranan, deep_verify_on, prob_threshold, calib_tuple)
     if site in ("Arama Sonucu Yok","Yeterli Skora Sahip Aday Yok"):
         sm = en_iyi_sosyal_medya_linkini_bul(firma_adi, tokens)
         return sm
     return site
 
+# ===== Async motor =====
+class AsyncMotor:
+    """Tek event loop (arka plan thread'i) üzerinde çalışan I/O motoru.
+
+    Bloklayan çağrılar (requests, DNS, TLS) ortak bir executor'da koşar; her çağrı önce
+    host semaforunu, sonra global semaforu alır. Böylece binlerce firma aynı anda
+    uçuşta olabilir ama toplam ve host başına istek sayısı sınırlı kalır.
+    """
+    def __init__(self, max_inflight:int, host_basina:int):
+        self.max_inflight = max_inflight
+        self.host_basina = host_basina
+        self.loop = asyncio.new_event_loop()
+        self.io_ex = ThreadPoolExecutor(max_workers=max_inflight, thread_name_prefix="async-io")
+        self.cpu_ex = ThreadPoolExecutor(max_workers=os.cpu_count() or 2, thread_name_prefix="async-cpu")
+        self._hostlar: Dict[str, list] = {}  # host -> [semafor, kullanan görev sayısı]; boşalınca silinir
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+        self._global = asyncio.run_coroutine_threadsafe(self._semafor(max_inflight), self.loop).result()
+
+    @staticmethod
+    async def _semafor(n:int) -> asyncio.Semaphore:
+        return asyncio.Semaphore(n)
+
+    async def io(self, host:str, fn, *args):
+        # host -> global sırası: host kuyruğunda bekleyen görev global slot tutmaz
+        # (_hostlar sadece event loop thread'inde değişir; kilit gerekmez)
+        host = host or "-"
+        kayit = self._hostlar.get(host)
+        if kayit is None:
+            kayit = self._hostlar[host] = [asyncio.Semaphore(self.host_basina), 0]
+        kayit[1] += 1
+        try:
+            async with kayit[0]:
+                async with self._global:
+                    return await self.loop.run_in_executor(self.io_ex, fn, *args)
+        finally:
+            kayit[1] -= 1
+            if not kayit[1]:
+                del self._hostlar[host]
+
+    async def yerel(self, fn, *args):
+        # ağ dışı iş (parse, cache okuma): semafor yok, event loop'u bloklamaz
+        return await self.loop.run_in_executor(self.cpu_ex, fn, *args)
+
+    def submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def kapat(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+        self.io_ex.shutdown(wait=False)
+        self.cpu_ex.shutdown(wait=False)
+
+async def afetch(motor:AsyncMotor, url:str) -> Optional[str]:
+    return await motor.io(alan_adini_ayikla(url), fetch, url, AYARLAR['ISTEK_ZAMAN_ASIMI'])
+
+async def arun_search(motor:AsyncMotor, query:str) -> List[str]:
+    cached = await motor.yerel(CACHE.get_results, query) if not KASET.mod else None
+    if cached is not None:
+        OLCUM.say('arama.cache_hit')
+        return cached
+    parts = await asyncio.gather(
+        motor.io("google", search_google, query, AYARLAR['GOOGLE_RESULTS_PER_QUERY']),
+        motor.io("duckduckgo.com", search_duckduckgo_html, query, AYARLAR['DUCK_RESULTS_PER_QUERY']),
+        return_exceptions=True)
+    results = []
+    for part in parts:
+        if isinstance(part, list):
+            results.extend(part)
+    return await motor.yerel(_arama_sonuclarini_kaydet, query, results)
+
+async def acontent_score(motor:AsyncMotor, url:str, firma_norm:str, sektorler:List[str], il:str, core_tokens:List[str]) -> Tuple[float,int,Dict[str,str]]:
+    html_text = await afetch(motor, url)
+    if not html_text: return 0.0, 0, {}
+    alan = alan_adini_ayikla(url)
+    sig, dns_ok, ssl_ok = await asyncio.gather(
+        motor.yerel(sayfa_sinyalleri, html_text),
+        motor.io(alan, has_dns_a_record, alan),
+        motor.io(alan, ssl_cn_matches, alan, core_tokens))
+    return _content_score_hesapla(url, html_text, sig, firma_norm, sektorler, il, dns_ok, ssl_ok)
+
+@OLCUM.olculen('deep_verify')
+async def adeep_verify(motor:AsyncMotor, base_url:str, firma_norm:str, sektorler:List[str], il:str, core_tokens:List[str], hedef:Optional[int]=None) -> Tuple[int,int]:
+    # deep_verify ile aynı keşif ve erken durma; kalan görevler hedefe ulaşınca iptal edilir
+    hedef = AYARLAR['MIN_SINYAL_AUTO_DOMAIN'] if hedef is None else hedef
+    async def _tek(url, html_text=None):
+        html_text = html_text or await afetch(motor, url)
+        if not html_text: return None
+        sig = await motor.yerel(sayfa_sinyalleri, html_text)
+        return content_signal_count(sig, url, firma_norm, sektorler, il)
+    total = 0
+    pages = 0
+    kok = await afetch(motor, base_url)
+    if kok:
+        try:
+            total += await _tek(base_url, kok); pages += 1
+        except Exception:
+            pass
+        if total >= hedef:
+            return total, pages
+    urls = await motor.yerel(_kok_baglantilari, base_url, kok) if kok else []
+    if not urls:
+        sm = await afetch(motor, _sitemap_url(base_url))
+        urls = (_sitemap_baglantilari(base_url, sm) if sm else []) or _tahmini_deep_urls(base_url)
+    gorevler = [asyncio.ensure_future(_tek(u)) for u in urls]
+    try:
+        for gorev in asyncio.as_completed(gorevler):
+            try:
+                s_cnt = await gorev
+            except Exception:
+                continue
+            if s_cnt is None: continue
+            total += s_cnt
+            pages += 1
+            if total >= hedef: break
+    finally:
+        for g in gorevler:
+            if not g.done(): g.cancel()
+    return total, pages
+
+async def aaday_alanlarini_ele(motor:AsyncMotor, urls:List[str]) -> List[str]:
+    hostlar = sorted({alan_adini_ayikla(u) for u in urls})
+    sonuc = await asyncio.gather(*[motor.io(h, _alan_durumu, h) for h in hostlar], return_exceptions=True)
+    durum = {h: d for h, d in zip(hostlar, sonuc) if isinstance(d, bool)}
+    return _on_eleme_uygula(urls, durum)
+
+async def acevap_veren_aday(motor:AsyncMotor, a:Dict) -> Dict:
+    if not a.get('yedekler') or await afetch(motor, a['url']):
+        return a
+    for y in a['yedekler']:
+        if await afetch(motor, y['url']):
+            return {**a, **y, 'yedekler': []}
+    return a
+
+async def aikizleri_sec(motor:AsyncMotor, adaylar:List[Dict], auto_set, firma_tokens:List[str]) -> List[Dict]:
+    hostlar = _ikiz_hostlari(adaylar, auto_set)
+    if not hostlar: return adaylar
+    sonuc = await asyncio.gather(*[motor.io(h, sertifika_adlari, h) for h in hostlar], return_exceptions=True)
+    https_ok = {h: d is not None for h, d in zip(hostlar, sonuc) if not isinstance(d, BaseException)}
+    return _ikiz_uygula(adaylar, auto_set, https_ok, firma_tokens)
+
+async def aen_iyi_sosyal_medya_linkini_bul(motor:AsyncMotor, firma_adi:str, firma_tokens:List[str]) -> str:
+    queries = [sablon.format(firma_adi=firma_adi, il="") for sablon in AYARLAR['SOSYAL_MEDYA_SORGULARI']]
+    aday = set()
+    for res in await asyncio.gather(*[arun_search(motor, q) for q in queries], return_exceptions=True):
+        if isinstance(res, list):
+            for u in res[:5]:
+                if is_social(u): aday.add(u)
+    return _sosyal_adaylari_sec(aday, firma_tokens)
+
+async def aen_iyi_siteyi_bul(motor:AsyncMotor, firma_adi:str, il:str, norm_firma:str, firma_tokens:List[str], aranan_sektorler:List[str], deep_verify_on:bool, prob_threshold:Optional[float], calib_tuple) -> str:
+    # en_iyi_siteyi_bul ile aynı karar akışı; sadece I/O motor üzerinden
+    queries = [sablon.format(firma_adi=firma_adi, il=il) for sablon in AYARLAR['ARAMA_SORGULARI']]
+    aramalar = asyncio.gather(*[arun_search(motor, q) for q in queries], return_exceptions=True)
+    auto_liste, sonuclar = await asyncio.gather(aaday_alanlarini_ele(motor, candidate_domains(firma_adi)), aramalar)
+    auto_set = set(auto_liste)
+    aday_adresler = set()
+    for res in sonuclar:
+        if isinstance(res, list):
+            aday_adresler.update(res)
+    tahminler = auto_set - aday_adresler
+    aday_adresler |= auto_set
+    if not aday_adresler:
+        return "Arama Sonucu Yok"
+
+    puanlanmis = adaylari_tekillestir(aday_adresler, tahminler, firma_tokens)
+    topk = sorted(puanlanmis, key=lambda x: x['puan'], reverse=True)[:AYARLAR['DOGRALANACAK_EN_IYI_ADAY_SAYISI']]
+    if not topk:
+        return "Arama Sonucu Yok"
+    topk = await aikizleri_sec(motor, topk, auto_set, firma_tokens)
+
+    GECER_MIN_PUAN = AYARLAR['GECER_MIN_PUAN']
+    MIN_SINYAL = AYARLAR['MIN_SINYAL_AUTO_DOMAIN']
+    core_tokens = marka_cekirdegi_tokenleri(norm_firma)
+
+    async def _aevaluate(a):
+        a = await acevap_veren_aday(motor, a)
+        html_text = await afetch(motor, a['url'])
+        sig = {}
+        sinyal_say = 0
+        puan = a['puan']
+        if html_text:
+            if await motor.yerel(ham_sayfa_park_mi, html_text):
+                return None
+            cs, cscnt, sig = await acontent_score(motor, a['url'], norm_firma, aranan_sektorler, il, core_tokens)
+            puan += cs
+            sinyal_say = cscnt
+        else:
+            if a['tahmin']:
+                return None
+        if deep_verify_on and (a['tahmin'] or sinyal_say == 0):
+            dv_sum, dv_pages = await adeep_verify(motor, a['url'], norm_firma, aranan_sektorler, il, core_tokens)
+            sinyal_say += dv_sum
+        if a['tahmin'] and sinyal_say < MIN_SINYAL:
+            return None
+        if sinyal_say == 0 and puan <= GECER_MIN_PUAN:
+            return None
+        rec = {'url': a['url'], 'puan': puan}
+        if calib_tuple[0]:
+            alan = alan_adini_ayikla(a['url'])
+            rec['_feats'] = await motor.io(alan, extract_features, a['url'], sig or _BOS_SIG, puan, norm_firma, aranan_sektorler, il, core_tokens)
+        return rec
+
+    sonuc = await asyncio.gather(*[_aevaluate(a) for a in topk], return_exceptions=True)
+    aday_gecerler = [r for r in sonuc if isinstance(r, dict)]
+    aday_gecerler = _kalibrasyonu_uygula(aday_gecerler, calib_tuple, prob_threshold)
+    if not aday_gecerler:
+        return "Yeterli Skora Sahip Aday Yok"
+
+    winner = max(aday_gecerler, key=lambda x: (x.get('proba', 0.0), x['puan']))
+    if winner.get('proba') is None and winner['puan'] <= GECER_MIN_PUAN:
+        return "Yeterli Skora Sahip Aday Yok"
+    return winner['url']
+
+async def afirma_icin_en_iyi_linki_bul(motor:AsyncMotor, firma_adi:str, sektor:str="", adres:str="", deep_verify_on=True, prob_threshold:Optional[float]=None, calib_tuple=(None,None), girdi=None) -> str:
+    if not firma_adi: return "Firma Adı Boş"
+    norm, tokens, il, aranan = girdi or firma_girdisi(firma_adi, sektor, adres)
+    calib_tuple = _kalib_coz(calib_tuple)
+    site = await aen_iyi_siteyi_bul(motor, firma_adi, il, norm, tokens, aranan, deep_verify_on, prob_threshold, calib_tuple)
+    if site in ("Arama Sonucu Yok","Yeterli Skora Sahip Aday Yok"):
+        return await aen_iyi_sosyal_medya_linkini_bul(motor, firma_adi, tokens)
+    return site
+
+# ===== Toplu işleme =====
+def _sirali_isle(baslat, girdiler, pencere:int):
+    """baslat(girdi) -> concurrent Future. En fazla `pencere` iş uçuşta tutulur, sonuçlar girdi sırasıyla döner."""
+    bekleyen = deque()
+    for g in girdiler:
+        bekleyen.append((g, baslat(g)))
+        if len(bekleyen) >= pencere:
+            g0, f0 = bekleyen.popleft()
+            yield g0, f0.result()
+    while bekleyen:
+        g0, f0 = bekleyen.popleft()
+        yield g0, f0.result()
+
+class Ilerleme:
+    """Toplu modlarda satır/sn ve kalan süre (ETA) raporu; en fazla `aralik` saniyede bir yazar.
+
+    toplam bilinmiyorsa (akış modu) None verilir; ETA yazılmaz.
+    """
+    def __init__(self, toplam:Optional[int], aralik:float=5.0):
+        self.toplam = toplam
+        self.aralik = aralik
+        self.bitti = 0
+        self.t0 = time.time()
+        self._son = 0.0
+
+    def adim(self, n:int=1):
+        self.bitti += n
+        simdi = time.time()
+        if simdi - self._son >= self.aralik or (self.toplam is not None and self.bitti >= self.toplam):
+            self._son = simdi
+            print(self.ozet(simdi))
+
+    def ozet(self, simdi:Optional[float]=None) -> str:
+        gecen = max((simdi or time.time()) - self.t0, 1e-9)
+        hiz = self.bitti / gecen
+        if self.toplam is None:
+            return f"[{self.bitti}] {hiz:.2f} satır/sn · geçen {time.strftime('%H:%M:%S', time.gmtime(gecen))}"
+        kalan = (self.toplam - self.bitti) / hiz if hiz > 0 else 0.0
+        eta = time.strftime("%H:%M:%S", time.gmtime(kalan))
+        return f"[{self.bitti}/{self.toplam}] {hiz:.2f} satır/sn · geçen {time.strftime('%H:%M:%S', time.gmtime(gecen))} · ETA {eta}"
+
+
 # ===== Review çıktı =====
-def calistir_review_modu(girdi="yenitest.csv", cikti_xlsx="review.xlsx", topk=3, deep_verify_on=True):
+def _review_satiri(firma:str, adres:str, sektor:str, topk:int, deep_verify_on:bool, girdi=None) -> Dict:
+    norm, tokens, il, aranan = girdi or firma_girdisi(firma, sektor, adres)
+    adaylar = en_iyi_site_adaylari(firma, il, norm, tokens, aranan, topk=topk, deep_verify_on=deep_verify_on)
+
+    base = {
+        "Firma Adı": firma,
+        "Adres": adres,
+        "Sektör": sektor,
+        "Seçilen Doğru URL": "",   # İnsan içi
+        "Doğru mu? (1/0)": "",     # İnsan içi
+    }
+    for idx in range(topk):
+        if idx < len(adaylar):
+            a = adaylar[idx]
+            base[f"Aday{idx+1} URL"] = a['url']
+            base[f"Aday{idx+1} Puan"] = round(a['puan'], 2)
+            base[f"Aday{idx+1} Kanıt"] = a['kanit'].get("flags","")
+            base[f"Aday{idx+1} Başlık"] = a['kanit'].get("title","")
+            base[f"Aday{idx+1} Sinyal"] = a['kanit'].get("sinyal","")
+        else:
+            base[f"Aday{idx+1} URL"] = ""
+            base[f"Aday{idx+1} Puan"] = ""
+            base[f"Aday{idx+1} Kanıt"] = ""
+            base[f"Aday{idx+1} Başlık"] = ""
+            base[f"Aday{idx+1} Sinyal"] = ""
+    if adaylar:
+        eniyi = adaylar[0]
+        base["Oto Öneri"] = eniyi['url']
+        conf = guven_skoru(eniyi)
+        base["Güven (0-100)"] = conf
+        base["İnceleme Önceliği"] = "YÜKSEK" if conf < 60 else ("ORTA" if conf < 80 else "DÜŞÜK")
+    else:
+        base["Oto Öneri"] = ""
+        base["Güven (0-100)"] = 0
+        base["İnceleme Önceliği"] = "YÜKSEK"
+    return base
+
+_ONCELIK_SIRASI = {"DÜŞÜK": 0, "ORTA": 1, "YÜKSEK": 2}  # alfabetik (pandas sıralamasıyla aynı)
+
+class ReviewYazici:
+    """Review satırlarını geldikçe JSONL yan dosyasına yazar (satır başı flush).
+
+    Bellekte sadece (öncelik, -güven, ofset) tutulur; bitiste bu anahtarlarla sıralanıp
+    yan dosyadan ofsetle okunarak openpyxl write-only çalışma kitabına akıtılır.
+    openpyxl yoksa aynı sırayla CSV yazılır. JSON tipleri (sayı/metin) korur.
+    """
+    def __init__(self, cikti_xlsx:str):
+        self.cikti = cikti_xlsx
+        self.yan = cikti_xlsx + ".part.jsonl"
+        self._f = open(self.yan, 'wb')
+        self._anahtarlar: List[Tuple[int, float, int]] = []
+        self._kolonlar: List[str] = []
+
+    def ekle(self, satir:Dict):
+        for k in satir:
+            if k not in self._kolonlar: self._kolonlar.append(k)
+        ofset = self._f.tell()
+        self._f.write(json.dumps(satir, ensure_ascii=False).encode('utf-8') + b"\n")
+        self._f.flush()
+        self._anahtarlar.append((_ONCELIK_SIRASI.get(satir.get("İnceleme Önceliği"), 3), -(satir.get("Güven (0-100)") or 0), ofset))
+
+    def _sirali_satirlar(self):
+        with open(self.yan, 'rb') as f:
+            for _o, _g, ofset in sorted(self._anahtarlar, key=lambda a: (a[0], a[1])):
+                f.seek(ofset)
+                satir = json.loads(f.readline())
+                yield [satir.get(k, "") for k in self._kolonlar]
+
+    def bitir(self) -> str:
+        self._f.close()
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            Workbook = None
+        if Workbook is not None:
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Sheet1")
+            ws.append(self._kolonlar)
+            for satir in self._sirali_satirlar():
+                ws.append([None if v == "" else v for v in satir])
+            wb.save(self.cikti)
+            hedef = self.cikti
+        else:
+            # openpyxl yoksa csv kaydet
+            hedef = self.cikti.replace(".xlsx",".csv")
+            with open(hedef, 'w', encoding='utf-8-sig', newline='') as f:
+                yazici = csv.writer(f, lineterminator='\n')
+                yazici.writerow(self._kolonlar)
+                yazici.writerows(self._sirali_satirlar())
+            print(f"⚠️ openpyxl yok; review CSV olarak kaydedildi: {hedef}")
+        os.remove(self.yan)
+        return hedef
+
+def calistir_review_modu(girdi="yenitest.csv", cikti_xlsx="review.xlsx", topk=3, deep_verify_on=True, workers:int=1):
     try:
         df = pd.read_csv(girdi, dtype=str)
     except FileNotFoundError:
@@ -994,78 +2801,73 @@ def calistir_review_modu(girdi="yenitest.csv", cikti_xlsx="review.xlsx", topk=3,
     if "Firma Adı" not in df.columns:
         print("HATA: 'Firma Adı' sütunu yok."); return
 
-    rows = []
     total = len(df)
-    for i, row in df.iterrows():
-        firma = row.get("Firma Adı","")
-        adres = row.get("Adres","")
-        sektor = row.get("Sektör","")
-        if not firma: continue
-        print(f"[{i+1}/{total}] 🏢 {firma}")
-
-        il = adresten_ili_al(adres)
-        norm = metni_normallestir(firma)
-        tokens = norm.split()
-        aranan = set()
-        if sektor:
-            for w in metni_normallestir(sektor).split():
-                if w: aranan.add(w)
-        for w in tokens:
-            if w in AYARLAR['SEKTOR_KELIMELERI']: aranan.add(w)
-
-        adaylar = en_iyi_site_adaylari(firma, il, norm, tokens, list(aranan), topk=topk, deep_verify_on=deep_verify_on)
-
-        base = {
-            "Firma Adı": firma,
-            "Adres": adres,
-            "Sektör": sektor,
-            "Seçilen Doğru URL": "",   # İnsan içi
-            "Doğru mu? (1/0)": "",     # İnsan içi
-        }
-        for idx in range(topk):
-            if idx < len(adaylar):
-                a = adaylar[idx]
-                base[f"Aday{idx+1} URL"] = a['url']
-                base[f"Aday{idx+1} Puan"] = round(a['puan'], 2)
-                base[f"Aday{idx+1} Kanıt"] = a['kanit'].get("flags","")
-                base[f"Aday{idx+1} Başlık"] = a['kanit'].get("title","")
-                base[f"Aday{idx+1} Sinyal"] = a['kanit'].get("sinyal","")
-            else:
-                base[f"Aday{idx+1} URL"] = ""
-                base[f"Aday{idx+1} Puan"] = ""
-                base[f"Aday{idx+1} Kanıt"] = ""
-                base[f"Aday{idx+1} Başlık"] = ""
-                base[f"Aday{idx+1} Sinyal"] = ""
-        if adaylar:
-            eniyi = adaylar[0]
-            base["Oto Öneri"] = eniyi['url']
-            conf = guven_skoru(eniyi)
-            base["Güven (0-100)"] = conf
-            base["İnceleme Önceliği"] = "YÜKSEK" if conf < 60 else ("ORTA" if conf < 80 else "DÜŞÜK")
-        else:
-            base["Oto Öneri"] = ""
-            base["Güven (0-100)"] = 0
-            base["İnceleme Önceliği"] = "YÜKSEK"
-
-        rows.append(base)
-        time.sleep(random.uniform(0.2, 0.5))
+    http_havuzunu_ayarla(workers)
+    hazir = girdileri_hazirla(df)
+    yazici = ReviewYazici(cikti_xlsx)
+    if workers > 1:
+        # toplu mod: firmalar paralel, satırlar girdi sırasıyla
+        dolu = [t for t in hazir.itertuples(name=None) if t[1]]
+        ilerleme = Ilerleme(len(dolu))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            def _baslat(t):
+                _i, firma, sektor, adres, g = t
+                return ex.submit(_review_satiri, firma, adres, sektor, topk, deep_verify_on, g)
+            for _t, base in _sirali_isle(_baslat, dolu, workers * 2):
+                yazici.ekle(base)
+                ilerleme.adim()
+    else:
+        for i, firma, sektor, adres, g in hazir.itertuples(name=None):
+            if not firma: continue
+            print(f"[{i+1}/{total}] 🏢 {firma}")
+            yazici.ekle(_review_satiri(firma, adres, sektor, topk, deep_verify_on, g))
+            time.sleep(random.uniform(0.2, 0.5))
 
-    rev = pd.DataFrame(rows)
-    try:
-        rev.sort_values(by=["İnceleme Önceliği","Güven (0-100)"], ascending=[True, False], inplace=True)
-    except Exception:
-        pass
-    try:
-        rev.to_excel(cikti_xlsx, index=False)
-    except Exception:
-        # openpyxl yoksa csv kaydet
-        alt = cikti_xlsx.replace(".xlsx",".csv")
-        rev.to_csv(alt, index=False, encoding='utf-8-sig')
-        print(f"⚠️ openpyxl yok; review CSV olarak kaydedildi: {alt}")
+    yazici.bitir()
     print(f"📄 Review çıktısı hazır: {cikti_xlsx}")
 
 # ===== Klasik tam akış =====
-def calistir_run_modu(girdi="yenitest.csv", cikti="firma_sonuclari_PRO.csv", deep_verify_on=True, prob_threshold:Optional[float]=None, calib_tuple=(None,None)):
+def _run_sonuclari(satirlar, toplam:Optional[int], deep_verify_on:bool, prob_threshold:Optional[float], calib_tuple, engine:str, workers:int):
+    """satirlar: (i, firma, sektor, adres, girdi, ...) demetleri. (satir, link) çiftlerini girdi sırasıyla üretir."""
+    if engine == "async" or workers > 1:
+        # toplu mod: satır başı bekleme yok, sonuçlar girdi sırasıyla yazılır
+        motor = ex = None
+        if engine == "async":
+            motor = AsyncMotor(AYARLAR['ASYNC_MAX_INFLIGHT'], AYARLAR['ASYNC_HOST_BASINA'])
+            pencere = AYARLAR['ASYNC_FIRMA_PENCERESI']
+            def _baslat(t):
+                _i, firma, sektor, adres, g = t[:5]
+                return motor.submit(afirma_icin_en_iyi_linki_bul(
+                    motor, firma, sektor, adres,
+                    deep_verify_on=deep_verify_on, prob_threshold=prob_threshold, calib_tuple=calib_tuple, girdi=g))
+        else:
+            ex = ThreadPoolExecutor(max_workers=workers)
+            pencere = workers * 2
+            def _baslat(t):
+                _i, firma, sektor, adres, g = t[:5]
+                return ex.submit(firma_icin_en_iyi_linki_bul, firma, sektor, adres,
+                                 deep_verify_on=deep_verify_on, prob_threshold=prob_threshold, calib_tuple=calib_tuple, girdi=g)
+        ilerleme = Ilerleme(toplam)
+        try:
+            for t, link in _sirali_isle(_baslat, satirlar, pencere):
+                yield t, link
+                ilerleme.adim()
+        finally:
+            if motor: motor.kapat()
+            if ex: ex.shutdown(wait=False, cancel_futures=True)
+    else:
+        for t in satirlar:
+            i, firma, sektor, adres, g = t[:5]
+            print(f"[{i+1}/{toplam if toplam is not None else '?'}] 🏢 Firma: {firma}")
+            link = firma_icin_en_iyi_linki_bul(firma, sektor, adres, deep_verify_on=deep_verify_on, prob_threshold=prob_threshold, calib_tuple=calib_tuple, girdi=g)
+            yield t, link
+            print(f"    └──> Sonuç: {link}\n")
+            time.sleep(random.uniform(0.25, 0.6))
+
+def calistir_run_modu(girdi="yenitest.csv", cikti="firma_sonuclari_PRO.csv", deep_verify_on=True, prob_threshold:Optional[float]=None, calib_tuple=(None,None), engine="thread", workers:int=1,
+                      akis:bool=False, parca:Optional[int]=None, devam:bool=False):
+    if akis or devam:
+        return _calistir_run_akis(girdi, cikti, deep_verify_on, prob_threshold, calib_tuple, engine, workers, parca or AYARLAR['AKIS_PARCA'], devam)
     try:
         df = pd.read_csv(girdi, dtype=str)
     except FileNotFoundError:
@@ -1075,24 +2877,123 @@ def calistir_run_modu(girdi="yenitest.csv", cikti="firma_sonuclari_PRO.csv", dee
         print("HATA: CSV'de 'Firma Adı' yok."); return
 
     print("Script Çalışıyor...\nNot: Hız için aramalar ve doğrulamalar paralelleştirildi, API anahtarı kullanılmıyor.")
-    out = []
-    total = len(df)
-    for i, row in df.iterrows():
-        firma = row.get("Firma Adı","")
-        adres = row.get("Adres","")
-        sektor = row.get("Sektör","")
-        print(f"[{i+1}/{total}] 🏢 Firma: {firma}")
-        link = firma_icin_en_iyi_linki_bul(firma, sektor, adres, deep_verify_on=deep_verify_on, prob_threshold=prob_threshold, calib_tuple=calib_tuple)
-        out.append(link)
-        print(f"    └──> Sonuç: {link}\n")
-        time.sleep(random.uniform(0.25, 0.6))
+    http_havuzunu_ayarla(workers, engine)
+    hazir = girdileri_hazirla(df)
+    out = [link for _t, link in _run_sonuclari(hazir.itertuples(name=None), len(df), deep_verify_on, prob_threshold, calib_tuple, engine, workers)]
 
     df["Bulunan Link"] = out
     df.to_csv(cikti, index=False, encoding='utf-8-sig')
     print(f"✅ İşlem tamamlandı! Sonuçlar '{cikti}' dosyasına yazıldı.")
 
+def _calistir_run_akis(girdi:str, cikti:str, deep_verify_on:bool, prob_threshold:Optional[float], calib_tuple, engine:str, workers:int, parca:int, devam:bool):
+    """Akış modu: girdi parça parça okunur, her sonuç bitince çıktıya eklenir.
+
+    <cikti>.ckpt dosyasına işlenen satır index'leri yazılır; devam=True ile bu satırlar atlanır.
+    Bellekte en fazla bir parça + uçuştaki pencere tutulur. Sıra girdi sırasıyla aynıdır.
+    Satır önce çıktıya sonra ckpt'ye yazılır: kesinti anındaki tek satır tekrar işlenebilir, kaybolmaz.
+    """
+    ckpt = cikti + ".ckpt"
+    biten = set()
+    if devam and os.path.exists(ckpt):
+        with open(ckpt, 'r', encoding='utf-8') as f:
+            biten = {int(x) for x in f.read().split()}
+    try:
+        parcalar = pd.read_csv(girdi, dtype=str, chunksize=parca)
+        ilk = next(parcalar, None)
+    except FileNotFoundError:
+        print(f"HATA: '{girdi}' dosyası bulunamadı."); return
+    if ilk is None or "Firma Adı" not in ilk.columns:
+        print("HATA: CSV'de 'Firma Adı' yok."); return
+    kolonlar = list(ilk.columns)
+    link_sira = kolonlar.index("Bulunan Link") if "Bulunan Link" in kolonlar else None
+    baslik = kolonlar if link_sira is not None else kolonlar + ["Bulunan Link"]
+
+    print("Script Çalışıyor (akış modu)...")
+    http_havuzunu_ayarla(workers, engine)
+    if biten:
+        print(f"↪️ {len(biten)} satır checkpoint'te; atlanıyor.")
+    yeni_dosya = not (devam and os.path.exists(cikti) and os.path.getsize(cikti) > 0)
+
+    def _satirlar():
+        # (i, firma, sektor, adres, girdi, ham_satir); bir sonraki parça ancak bu parça tüketilince okunur
+        p = ilk
+        while p is not None:
+            p = p.fillna("")
+            hazir = girdileri_hazirla(p)
+            for t, ham in zip(hazir.itertuples(name=None), p.itertuples(index=False, name=None)):
+                if t[0] in biten: continue
+                yield t + (ham,)
+            p = next(parcalar, None)
+
+    with open(cikti, 'w' if yeni_dosya else 'a', encoding='utf-8-sig', newline='') as f_out, \
+         open(ckpt, 'w' if not devam else 'a', encoding='utf-8') as f_ckpt:
+        yazici = csv.writer(f_out, lineterminator='\n')
+        if yeni_dosya:
+            yazici.writerow(baslik)
+        n = 0
+        for t, link in _run_sonuclari(_satirlar(), None, deep_verify_on, prob_threshold, calib_tuple, engine, workers):
+            satir = list(t[5])
+            if link_sira is None: satir.append(link)
+            else: satir[link_sira] = link
+            yazici.writerow(satir)
+            f_out.flush()
+            f_ckpt.write(f"{t[0]}\n")
+            f_ckpt.flush()
+            n += 1
+    print(f"✅ İşlem tamamlandı! {n} satır '{cikti}' dosyasına eklendi (checkpoint: {ckpt}).")
+
 # ===== Kalibrasyon (review.xlsx -> model) =====
-def calibrate_from_review(review_path: str):
+def _atomik_yaz(yol:str, veri:bytes):
+    """Geçici dosyaya yazıp os.replace ile değiştirir; okuyan süreç yarım dosya görmez."""
+    gecici = f"{yol}.{os.getpid()}.tmp"
+    try:
+        with open(gecici, 'wb') as f:
+            f.write(veri)
+        os.replace(gecici, yol)
+    finally:
+        if os.path.exists(gecici):
+            os.remove(gecici)
+
+def _kalibrasyon_ozelligi(satir) -> Optional[Tuple[List[float], bool]]:
+    """dönüş: (özellikler, feature_store'dan mı)"""
+    norm, url, il, aranan, _label = satir
+    try:
+        feats = CACHE.get_features(norm, url, FEATURE_VERSION)
+        if feats is not None:
+            return feats, True
+        # review sırasında kaydedilmemiş (ör. elle girilen URL): bir kez hesapla ve sakla
+        html_text = fetch(url, AYARLAR['ISTEK_ZAMAN_ASIMI'])
+        sig = sayfa_sinyalleri(html_text) if html_text else _BOS_SIG
+        feats = extract_features(url, sig, 0.0, norm, aranan, il, marka_cekirdegi_tokenleri(norm))
+        CACHE.set_features(norm, url, FEATURE_VERSION, feats)
+        return feats, False
+    except Exception:
+        return None
+
+def _artimli_model():
+    """Var olan artımlı (SGD) modeli, model dosyası yoksa eğitilmemiş yenisini döner; katlanan_ = modele işlenmiş etiketler.
+
+    Dosyada artımlı olmayan (lojistik) bir model varsa None döner: tek geçişlik SGD ile onun üzerine yazılmaz.
+    """
+    from sklearn.linear_model import SGDClassifier
+    try:
+        with open(AYARLAR['CALIB_MODEL'],'rb') as f:
+            model = pickle.load(f)
+    except Exception:
+        model = None
+    if model is not None:
+        if isinstance(model, SGDClassifier) and hasattr(model, 'katlanan_'):
+            return model
+        print(f"ℹ️ Mevcut model artımlı değil; üzerine yazılmıyor, tam kalibrasyon yapılıyor "
+              f"(artımlı modele geçmek için önce {AYARLAR['CALIB_MODEL']} dosyasını silin).")
+        return None
+    # ölçeklenmemiş url_score özelliği yüzünden varsayılan 'optimal' adım ıraksıyor; adaptive + ortalama kararlı
+    model = SGDClassifier(loss='log_loss', alpha=1e-3, learning_rate='adaptive', eta0=0.01, average=True,
+                          max_iter=1000, tol=1e-4, random_state=0)
+    model.katlanan_ = set()
+    return model
+
+def calibrate_from_review(review_path: str, artimli: bool = False, workers: Optional[int] = None):
     try:
         rev = pd.read_excel(review_path)
     except Exception:
@@ -1101,11 +3002,12 @@ def calibrate_from_review(review_path: str):
         except Exception as e:
             print(f"HATA: review dosyası okunamadı: {e}")
             return
+    rev = rev.fillna("")
     needed_cols = ["Firma Adı","Sektör","Doğru mu? (1/0)","Oto Öneri"]
     for c in needed_cols:
         if c not in rev.columns:
             print(f"HATA: review dosyasında '{c}' sütunu yok."); return
-    X, y = [], []
+    satirlar = []
     for _, r in rev.iterrows():
         try:
             label = r.get("Doğru mu? (1/0)")
@@ -1115,30 +3017,57 @@ def calibrate_from_review(review_path: str):
             sektor = r.get("Sektör","")
             url = r.get("Seçilen Doğru URL") or r.get("Oto Öneri")
             if not (firma and url): continue
-            norm = metni_normallestir(firma)
-            tokens = norm.split()
-            aranan = set()
-            if sektor:
-                for w in metni_normallestir(sektor).split():
-                    if w: aranan.add(w)
-            for w in tokens:
-                if w in AYARLAR['SEKTOR_KELIMELERI']: aranan.add(w)
-            html_text = fetch(url, AYARLAR['ISTEK_ZAMAN_ASIMI'])
-            sig = extract_text_signals(html_text) if html_text else {"title":"","metas":"","og":"","h":"","footer":"","full":""}
-            feats = extract_features(url, sig, 0.0, norm, list(aranan), "", marka_cekirdegi_tokenleri(norm))
-            X.append(feats); y.append(label)
+            norm, tokens, il, aranan = firma_girdisi(firma, sektor, r.get("Adres",""))
+            satirlar.append((norm, url, il, aranan, label))
         except Exception:
             continue
+
+    model = None
+    if artimli:
+        try:
+            model = _artimli_model()
+        except ImportError:
+            print("ℹ️ sklearn bulunamadı; artımlı mod yerine tam kalibrasyon yapılıyor.")
+        if model is not None:
+            satirlar = [s for s in satirlar if (s[0], s[1], s[4]) not in model.katlanan_]
+            if not satirlar:
+                print("ℹ️ Modele katlanacak yeni etiket yok."); return
+
+    # eksik özellikler paralel hesaplanır; sıra satır sırasıyla aynı
+    X, y, anahtarlar = [], [], []
+    bulunan = hesaplanan = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers or AYARLAR['CALIB_ISCI'])) as ex:
+        for satir, sonuc in zip(satirlar, ex.map(_kalibrasyon_ozelligi, satirlar)):
+            if sonuc is None: continue
+            feats, depodan = sonuc
+            if depodan: bulunan += 1
+            else: hesaplanan += 1
+            X.append(feats); y.append(satir[4]); anahtarlar.append((satir[0], satir[1], satir[4]))
+    print(f"ℹ️ Özellikler: {bulunan} feature store'dan, {hesaplanan} yeniden hesaplandı.")
     if not X:
         print("Kalibrasyon için yeterli etiketli veri yok."); return
+
+    if model is not None:
+        import numpy as np
+        Xn, yn = np.array(X, dtype=float), np.array(y)
+        if not model.katlanan_:
+            # ilk eğitim: tek partial_fit geçişi kalibre olasılık vermez; karıştırılmış çok epoch'lu fit
+            if len(set(y)) < 2:
+                print("HATA: ilk artımlı model için hem doğru (1) hem yanlış (0) etiket gerekli."); return
+            model.fit(Xn, yn)
+        else:
+            model.partial_fit(Xn, yn)
+        model.katlanan_.update(anahtarlar)
+        _atomik_yaz(AYARLAR['CALIB_MODEL'], pickle.dumps(model))
+        print(f"✅ Artımlı kalibrasyon: {len(X)} yeni etiket modele katlandı ({len(model.katlanan_)} toplam): {AYARLAR['CALIB_MODEL']}")
+        return
     # sklearn varsa lojistik; yoksa basit korelasyon temelli ağırlık
     try:
         from sklearn.linear_model import LogisticRegression
         import numpy as np
         model = LogisticRegression(max_iter=1000, solver='lbfgs')
         model.fit(np.array(X), np.array(y))
-        with open(AYARLAR['CALIB_MODEL'],'wb') as f:
-            pickle.dump(model, f)
+        _atomik_yaz(AYARLAR['CALIB_MODEL'], pickle.dumps(model))
         print(f"✅ Kalibrasyon modeli kaydedildi: {AYARLAR['CALIB_MODEL']}")
     except Exception as e:
         # fallback: korelasyon tabanlı ağırlıklar
@@ -1150,8 +3079,7 @@ def calibrate_from_review(review_path: str):
         weights = corr.tolist()
         bias = float(-(np.array(weights) @ Xn.mean(axis=0)))
         data = {"weights": weights, "bias": bias, "features": FEATURE_ORDER}
-        with open(AYARLAR['CALIB_JSON_FALLBACK'],'w',encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        _atomik_yaz(AYARLAR['CALIB_JSON_FALLBACK'], json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'))
         print(f"ℹ️ sklearn bulunamadı; korelasyon temelli kalibrasyon kaydedildi: {AYARLAR['CALIB_JSON_FALLBACK']}")
 
 # ===== CLI =====
@@ -1163,20 +3091,47 @@ def main():
     parser.add_argument("--deep-verify", choices=["on","off"], default="on")
     parser.add_argument("--prob-threshold", type=float, default=None, help="Kalibre olasılık eşiği (örn 0.65)")
     parser.add_argument("--calibrate-from", default="", help="review.xlsx yolunu ver; model üretir")
+    parser.add_argument("--incremental", action="store_true", help="--calibrate-from ile: sadece yeni etiketleri mevcut SGD modeline katla (partial_fit)")
+    parser.add_argument("--cache-stats", action="store_true", help="bitişte cache hit oranı ve sıkıştırma kazancını yazdır")
+    parser.add_argument("--pool-stats", action="store_true", help="bitişte HTTP havuzu istatistiklerini yazdır (yeni / yeniden kullanılan / atılan bağlantı)")
+    parser.add_argument("--profile", action="store_true", help="bitişte aşama başına süre histogramı + sayaçları (cache hit, neg-cache, ağ isteği) JSON olarak yazdır")
+    parser.add_argument("--prom-file", default="", help="ölçümleri Prometheus textfile biçiminde bu dosyaya yaz (node_exporter textfile collector)")
+    parser.add_argument("--cassette-mode", choices=["record","replay"], default=None, help="record: fetch/arama/DNS/SSL yanıtlarını kasete yaz; replay: ağa çıkmadan kasetten oku")
+    parser.add_argument("--cassette", default="", help="kaset dosyası (varsayılan AYARLAR['KASET_DOSYASI'])")
+    parser.add_argument("--workers", type=int, default=1, help="N>1: N firma paralel işlenir (toplu mod, sıra korunur)")
+    parser.add_argument("--engine", choices=["thread","async"], default="thread", help="async: tüm firmalar tek event loop'ta, global + host başına sınırlı (run modu)")
+    parser.add_argument("--stream", action="store_true", help="run modu: girdiyi parça parça oku, her sonucu bitince çıktıya ekle (<cikti>.ckpt tutulur)")
+    parser.add_argument("--chunksize", type=int, default=None, help="--stream parça boyu (varsayılan AYARLAR['AKIS_PARCA'])")
+    parser.add_argument("--resume", action="store_true", help="run modu: <cikti>.ckpt'deki satırları atla, çıktıya eklemeye devam et (--stream içerir)")
     args = parser.parse_args()
 
     if args.calibrate_from:
-        calibrate_from_review(args.calibrate_from)
+        calibrate_from_review(args.calibrate_from, artimli=args.incremental)
         # kalibrasyon sadece yapılır; istersen ardından mode da çalışır
-    calib_tuple = load_calibration()
+    # model bir kez yüklenir; çalışma sırasında dosya değişirse firmalar arasında yenisine geçilir
+    calib_tuple = KALIBRASYON
 
     deep_on = (args.deep_verify == "on")
+    if args.cassette_mode:
+        KASET.ac(args.cassette_mode, args.cassette or None)
+    OLCUM.sifirla()  # kalibrasyon eğitimi ölçüme karışmasın
     if args.mode == "review":
         out = args.output or "review.xlsx"
-        calistir_review_modu(args.input, out, topk=3, deep_verify_on=deep_on)
+        calistir_review_modu(args.input, out, topk=3, deep_verify_on=deep_on, workers=args.workers)
     else:
         out = args.output or "firma_sonuclari_PRO.csv"
-        calistir_run_modu(args.input, out, deep_verify_on=deep_on, prob_threshold=args.prob_threshold, calib_tuple=calib_tuple)
+        calistir_run_modu(args.input, out, deep_verify_on=deep_on, prob_threshold=args.prob_threshold, calib_tuple=calib_tuple, engine=args.engine, workers=args.workers,
+                          akis=args.stream, parca=args.chunksize, devam=args.resume)
+    if args.cache_stats:
+        print("📊 Cache istatistikleri:")
+        print(json.dumps(CACHE.istatistik(), ensure_ascii=False, indent=2))
+    if args.pool_stats:
+        print("🔌 HTTP havuzu istatistikleri:")
+        print(json.dumps(havuz_istatistik(), ensure_ascii=False, indent=2))
+    if KASET.mod:
+        KASET.kapat()
+        print("📼 Kaset: " + json.dumps(KASET.istatistik(), ensure_ascii=False))
+    olcum_raporu(args.profile, args.prom_file or None)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file